@@ -2,6 +2,8 @@ import json
 import logging
 from typing import Optional, Union, List, Dict
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from json.decoder import JSONDecodeError
 from requests.exceptions import RequestException
 
@@ -17,6 +19,8 @@ from fantraxapi.drops import DropsService
 
 logger = logging.getLogger(__name__)
 
+_FANTRAX_PREFIX = "https://www.fantrax.com"
+
 
 class FantraxAPI:
 	""" Main API wrapper for Fantrax private endpoints. """
@@ -24,6 +28,7 @@ class FantraxAPI:
 	def __init__(self, league_id: str, session: Optional[Session] = None):
 		self.league_id = league_id
 		self._session = Session() if session is None else session
+		self._tune_session(self._session)
 		self._teams: Optional[List[Team]] = None
 		self._positions: Optional[Dict[str, Position]] = None
 		# Feature services
@@ -32,6 +37,24 @@ class FantraxAPI:
 		self.waivers = WaiversService(self._request, self)
 		self.drops = DropsService(self)
 
+	@staticmethod
+	def _tune_session(session: Session) -> None:
+		"""
+		Pool + keep-alive for the single FXPA host, shared by every service on
+		this session. Mounted on the host prefix so a caller-installed adapter
+		for that host is left alone. Only connection failures are retried:
+		FXPA calls are POSTs that may change rosters, so error statuses are
+		returned to the caller (see SubsService._post_fxpa for 429 back-off).
+		"""
+		if _FANTRAX_PREFIX not in session.adapters:
+			session.mount(_FANTRAX_PREFIX, HTTPAdapter(
+				pool_connections=16,
+				pool_maxsize=16,
+				max_retries=Retry(total=3, backoff_factor=0.3),
+			))
+		session.headers.setdefault("Accept-Encoding", "gzip, deflate")
+		session.headers.setdefault("Connection", "keep-alive")
+
 	@property
 	def teams(self) -> List[Team]:
 		if self._teams is None:
@@ -111,47 +134,59 @@ class FantraxAPI:
 
 	def _request(self, method, **kwargs):
 		"""Low-level request helper. Returns the inner .responses[0].data."""
-		data = {"leagueId": self.league_id}
-		data.update(kwargs)
-		json_data = {"msgs": [{"method": method, "data": data}]}
+		return self._request_batch([(method, kwargs)])[0]
+
+	def _request_batch(self, calls: List[tuple]) -> List[dict]:
+		"""
+		Send several (method, kwargs) calls as one FXPA request (one entry per
+		call in ``msgs``). Returns each .responses[i].data, in call order.
+		"""
+		msgs = []
+		for method, kwargs in calls:
+			data = {"leagueId": self.league_id}
+			data.update(kwargs)
+			msgs.append({"method": method, "data": data})
+		json_data = {"msgs": msgs}
+		label = ", ".join(m["method"] for m in msgs)
 
 		# Log exact payload for lineup changes for easier diffing against web UI
-		if method == "confirmOrExecuteTeamRosterChanges":
+		if any(m["method"] == "confirmOrExecuteTeamRosterChanges" for m in msgs) and logger.isEnabledFor(logging.INFO):
 			logger.info("Request JSON (confirmOrExecuteTeamRosterChanges):\n%s", json.dumps(json_data, indent=2, ensure_ascii=False))
 
 		try:
 			response = self._session.post(
-				"https://www.fantrax.com/fxpa/req",
+				f"{_FANTRAX_PREFIX}/fxpa/req",
 				params={"leagueId": self.league_id},
 				json=json_data
 			)
 			response_json = response.json()
 		except (RequestException, JSONDecodeError) as e:
-			raise FantraxException(f"Failed to Connect to {method}: {e}\nData: {data}")
+			raise FantraxException(f"Failed to Connect to {label}: {e}\nData: {[m['data'] for m in msgs]}")
 
 		# Extract and log only relevant parts of the response
-		resp0 = response_json.get("responses", [{}])[0]
-		data = resp0.get("data", {})
-		fr = data.get("fantasyResponse", {}) or {}
-		model = (fr.get("textArray", {}) or {}).get("model", {}) or {}
-		
-		# Only log the most relevant fields
-		if method == "confirmOrExecuteTeamRosterChanges":
-			logger.debug("Response (%s [%s]): msgType=%s mainMsg=%s illegal=%s changeAllowed=%s period=%s deadline=%s", 
-				response.status_code, response.reason,
-				fr.get("msgType"),
-				fr.get("mainMsg"),
-				fr.get("illegalRosterMsgs"),
-				model.get("changeAllowed"),
-				model.get("rosterLimitPeriod"),
-				model.get("playerPickDeadlinePassed")
-			)
-		else:
-			logger.debug("Response (%s [%s]): msgType=%s mainMsg=%s", 
-				response.status_code, response.reason,
-				fr.get("msgType"),
-				fr.get("mainMsg")
-			)
+		responses = response_json.get("responses") or [{}]
+		for m, resp in zip(msgs, responses):
+			data = resp.get("data", {})
+			fr = data.get("fantasyResponse", {}) or {}
+			model = (fr.get("textArray", {}) or {}).get("model", {}) or {}
+
+			# Only log the most relevant fields
+			if m["method"] == "confirmOrExecuteTeamRosterChanges":
+				logger.debug("Response (%s [%s]): msgType=%s mainMsg=%s illegal=%s changeAllowed=%s period=%s deadline=%s", 
+					response.status_code, response.reason,
+					fr.get("msgType"),
+					fr.get("mainMsg"),
+					fr.get("illegalRosterMsgs"),
+					model.get("changeAllowed"),
+					model.get("rosterLimitPeriod"),
+					model.get("playerPickDeadlinePassed")
+				)
+			else:
+				logger.debug("Response (%s [%s]): msgType=%s mainMsg=%s", 
+					response.status_code, response.reason,
+					fr.get("msgType"),
+					fr.get("mainMsg")
+				)
 
 		if response.status_code >= 400:
 			raise FantraxException(f"({response.status_code} [{response.reason}]) {response_json}")
@@ -162,7 +197,20 @@ class FantraxAPI:
 				raise Unauthorized("Unauthorized: Not Logged in")
 			raise FantraxException(f"Error: {response_json}")
 
-		return response_json["responses"][0]["data"]
+		results = []
+		responses = response_json.get("responses") or []
+		if len(responses) != len(msgs):
+			raise FantraxException(f"Expected {len(msgs)} responses for {label}, got {len(responses)}: {response_json}")
+		for i, (m, resp) in enumerate(zip(msgs, responses)):
+			if "pageError" in resp:
+				pe = resp["pageError"]
+				if "code" in pe and pe["code"] == "WARNING_NOT_LOGGED_IN":
+					raise Unauthorized("Unauthorized: Not Logged in")
+				raise FantraxException(f"Error in msg {i} ({m['method']}): {resp}")
+			if "data" not in resp:
+				raise FantraxException(f"No data for msg {i} ({m['method']}): {resp}")
+			results.append(resp["data"])
+		return results
 
 	# ---------- Higher-level helpers ----------
 	def scoring_periods(self) -> Dict[int, ScoringPeriod]:
@@ -456,18 +504,19 @@ class FantraxAPI:
 		logger.info("Sending confirmation request...")
 		try:
 			confirm_resp = self._request("confirmOrExecuteTeamRosterChanges", **confirm_data)
-			preview = json.dumps(confirm_resp, indent=2, ensure_ascii=False)
-			if len(preview) > 500:
-				preview = preview[:250] + "\n...[truncated]...\n" + preview[-250:]
-			logger.debug("Confirmation response:\n%s", preview)
+			if logger.isEnabledFor(logging.DEBUG):
+				preview = json.dumps(confirm_resp, indent=2, ensure_ascii=False)
+				if len(preview) > 500:
+					preview = preview[:250] + "\n...[truncated]...\n" + preview[-250:]
+				logger.debug("Confirmation response:\n%s", preview)
 		except FantraxException as e:
 			logger.error(f"Confirmation request failed: {e}")
 			raise
 
-		execute_data = dict(confirm_data)
-		execute_data["confirm"] = False
-		execute_data["action"] = "EXECUTE"
-		execute_data["acceptWarnings"] = True
+		# _request copies kwargs into its own payload, so the confirm dict is
+		# free to be reused for the execute step
+		execute_data = confirm_data
+		execute_data.update(confirm=False, action="EXECUTE", acceptWarnings=True)
 
 		# If the server presents a confirm window, include a sensible default "type"
 		try:
@@ -480,10 +529,11 @@ class FantraxAPI:
 		logger.info("Sending execution request...")
 		try:
 			exec_resp = self._request("confirmOrExecuteTeamRosterChanges", **execute_data)
-			preview = json.dumps(exec_resp, indent=2, ensure_ascii=False)
-			if len(preview) > 500:
-				preview = preview[:250] + "\n...[truncated]...\n" + preview[-250:]
-			logger.debug("Execution response:\n%s", preview)
+			if logger.isEnabledFor(logging.DEBUG):
+				preview = json.dumps(exec_resp, indent=2, ensure_ascii=False)
+				if len(preview) > 500:
+					preview = preview[:250] + "\n...[truncated]...\n" + preview[-250:]
+				logger.debug("Execution response:\n%s", preview)
 		except FantraxException as e:
 			logger.error(f"Execution request failed: {e}")
 			raise
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from .exceptions import FantraxException
 from .objs import Roster
@@ -10,13 +10,17 @@ class LeagueService:
 	def __init__(self, request_callable, api):
 		self._request = request_callable
 		self._api = api
+		# League-wide claim settings seen on the last faab_budgets() call
+		self.claim_settings: Optional[dict] = None
 
 	def list_rosters(self) -> List[Roster]:
-		"""Return the current roster for every team in the league."""
-		rosters: List[Roster] = []
-		for team in self._api.teams:
-			rosters.append(self._api.roster_info(team.team_id))
-		return rosters
+		"""Return the current roster for every team in the league.
+
+		All getTeamRosterInfo calls go out as one FXPA request (one msg per team).
+		"""
+		team_ids = [team.team_id for team in self._api.teams]
+		responses = self._api._request_batch([("getTeamRosterInfo", {"teamId": tid}) for tid in team_ids])
+		return [Roster(self._api, data, tid) for tid, data in zip(team_ids, responses)]
 
 	def get_roster(self, team_id: str) -> Roster:
 		"""Return the roster for a specific team."""
@@ -32,13 +36,20 @@ class LeagueService:
 				- tradeable: bool - Whether budget can be traded
 		"""
 		budgets = {}
-		for team in self._api.teams:
-			# Get the claim/waiver page for this team to see their budget
-			response = self._request("getTeamRosterInfo", teamId=team.team_id, view="CLAIMS")
+		# Every team's claim/waiver page (which shows its budget) in one FXPA request
+		team_ids = [team.team_id for team in self._api.teams]
+		responses = self._api._request_batch([
+			("getTeamRosterInfo", {"teamId": tid, "view": "CLAIMS"}) for tid in team_ids
+		])
+		# The CLAIMS view also carries the league-wide claim settings; keep them
+		# so get_claims_overview need not request that view again
+		if responses:
+			self.claim_settings = self._claim_settings(responses[0])
+		for team_id, response in zip(team_ids, responses):
 			if "miscData" in response and "transactionSalaryBudgetInfo" in response["miscData"]:
 				for budget in response["miscData"]["transactionSalaryBudgetInfo"]:
 					if budget["key"] == "claimBudget":
-						budgets[team.team_id] = {
+						budgets[team_id] = {
 							"value": float(budget["value"]),
 							"display": budget["display"],
 							"tradeable": budget.get("tradeable", False)
@@ -60,17 +71,58 @@ class LeagueService:
 				- showBidColumn: Whether FAAB bidding is enabled
 				- pendingClaims: List of pending claims with details
 		"""
-		# Get basic claim info
+		# Basic claim info, then detailed pending claims via roster view
 		info_response = self._request("getTeamRosterInfo", teamId=team_id, view="CLAIMS")
-		info = {
-			"numPendingClaims": info_response.get("numPendingClaims", 0),
+		claims_response = self._request("getTeamRosterInfo", teamId=team_id, view="PENDING_CLAIMS")
+		return self._claim_info(info_response, claims_response)
+
+	def get_claims_overview(self, team_ids: List[str]) -> dict:
+		"""League claim settings plus every team's pending claims in one FXPA request.
+
+		Claim settings are league-wide: they are reused from the last
+		faab_budgets() call when available, otherwise only the first team's
+		CLAIMS view is requested alongside each team's PENDING_CLAIMS view.
+
+		Returns:
+			dict: Overview containing:
+				- settings: claimTypes, claimGroupsEnabled and showBidColumn
+				- pendingClaims: Map of team_id to its pending claims
+		"""
+		settings = self.claim_settings
+		if not team_ids:
+			return {"settings": settings or self._claim_settings({}), "pendingClaims": {}}
+		calls = [] if settings else [("getTeamRosterInfo", {"teamId": team_ids[0], "view": "CLAIMS"})]
+		calls += [("getTeamRosterInfo", {"teamId": tid, "view": "PENDING_CLAIMS"}) for tid in team_ids]
+		responses = self._api._request_batch(calls)
+		if not settings:
+			settings = self._claim_settings(responses[0])
+			responses = responses[1:]
+		return {
+			"settings": settings,
+			"pendingClaims": {tid: self._pending_claims(resp) for tid, resp in zip(team_ids, responses)},
+		}
+
+	@staticmethod
+	def _claim_settings(info_response: dict) -> dict:
+		misc = info_response.get("miscData", {})
+		return {
 			"claimTypes": info_response.get("claimTypes", {}),
-			"claimGroupsEnabled": info_response.get("miscData", {}).get("claimGroupsEnabled", False),
-			"showBidColumn": info_response.get("miscData", {}).get("showBidColumn", False)
+			"claimGroupsEnabled": misc.get("claimGroupsEnabled", False),
+			"showBidColumn": misc.get("showBidColumn", False)
 		}
-		
-		# Get detailed pending claims via roster view
-		claims_response = self._request("getTeamRosterInfo", teamId=team_id, view="PENDING_CLAIMS")
+
+	@classmethod
+	def _claim_info(cls, info_response: dict, claims_response: dict) -> dict:
+		info = {"numPendingClaims": info_response.get("numPendingClaims", 0)}
+		info.update(cls._claim_settings(info_response))
+		pending_claims = cls._pending_claims(claims_response)
+		info["pendingClaims"] = pending_claims
+		# Prefer computed count if available
+		info["numPendingClaims"] = len(pending_claims)
+		return info
+
+	@staticmethod
+	def _pending_claims(claims_response: dict) -> List[dict]:
 		pending_claims = []
 
 		if "tables" in claims_response:
@@ -104,10 +156,6 @@ class LeagueService:
 								"from_status": claim.get("fromStatusName")
 							} if "dropOrMoveScorer" in claim else None)
 						})
-
-		info["pendingClaims"] = pending_claims
-		# Prefer computed count if available
-		info["numPendingClaims"] = len(pending_claims)
-		return info
+		return pending_claims
 
 
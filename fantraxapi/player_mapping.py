@@ -8,13 +8,16 @@ This module provides functionality to:
 4. Highlight players that are not mapped
 """
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 import re
 import yaml
 import logging
 from pydantic import BaseModel, Field
 from unidecode import unidecode
 
+# libyaml's emitter when PyYAML was built with it, else the pure-Python one
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 class PlayerMapping(BaseModel):
 	"""Player mapping entry."""
 	fantrax_id: str
@@ -64,7 +67,7 @@ class PlayerMappingManager:
 		
 		# Save to file with UTF-8 encoding and no unnecessary escaping
 		with open(self.mapping_file, 'w', encoding='utf-8') as f:
-			yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True, default_flow_style=False)
+			yaml.dump(data, f, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True, default_flow_style=False)
 	
 	def add_mapping(self, mapping: PlayerMapping) -> None:
 		"""
@@ -73,13 +76,28 @@ class PlayerMappingManager:
 		Args:
 			mapping: PlayerMapping instance to add
 		"""
+		self._store(mapping)
+		self.save_mappings()
+	
+	def add_mappings(self, mappings: Iterable[PlayerMapping]) -> None:
+		"""
+		Add several player mappings and write the file once.
+		
+		Args:
+			mappings: PlayerMapping instances to add
+		"""
+		for mapping in mappings:
+			self._store(mapping)
+		self.save_mappings()
+	
+	def _store(self, mapping: PlayerMapping) -> None:
+		"""Fill in the display name if missing and index the mapping in memory."""
 		# Generate display name if not provided
 		if not mapping.display_name:
 			# Use the new smart display name selection that analyzes all sources
 			mapping.display_name = self._get_best_display_name(mapping)
 				
 		self._mappings[mapping.fantrax_id] = mapping
-		self.save_mappings()
 	
 	def get_by_fantrax_id(self, fantrax_id: str) -> Optional[PlayerMapping]:
 		"""Get mapping by Fantrax ID."""
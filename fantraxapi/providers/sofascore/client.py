@@ -9,6 +9,8 @@ from typing import Dict, List, Optional
 import httpx
 from tenacity import retry, wait_exponential, stop_after_attempt
 
+from .discover import make_client
+
 logger = logging.getLogger(__name__)
 
 # API configuration
@@ -41,39 +43,46 @@ async def get_season_id() -> int:
 				return season["id"]
 	raise ValueError(f"Season {PREMIER_LEAGUE_SEASON} not found")
 
-async def get_matches(date: Optional[datetime] = None) -> List[Dict]:
+async def get_matches(
+	date: Optional[datetime] = None,
+	client: Optional[httpx.AsyncClient] = None
+) -> List[Dict]:
 	"""
 	Get Premier League matches for a specific date.
 	
 	Args:
 		date: Date to get matches for (defaults to today)
+		client: AsyncClient to reuse (a pooled one is created if omitted)
 		
 	Returns:
 		List of match dictionaries
 	"""
+	if client is None:
+		async with make_client() as client:
+			return await get_matches(date, client)
+	
 	date = date or datetime.now(timezone.utc)
 	date_str = date.strftime("%Y-%m-%d")
 	
-	async with httpx.AsyncClient() as client:
-		# Get all matches for the date
-		url = f"{API_BASE}/sport/football/scheduled-events/{date_str}"
-		response = await get_json(client, url)
-		
-		# Filter for Premier League matches
-		matches = []
-		for event in response.get("events", []):
-			tournament = event.get("tournament", {}).get("uniqueTournament", {})
-			if tournament.get("id") == PREMIER_LEAGUE_ID:
-				matches.append(event)
+	# Get all matches for the date
+	url = f"{API_BASE}/sport/football/scheduled-events/{date_str}"
+	response = await get_json(client, url)
+	
+	# Filter for Premier League matches
+	matches = []
+	for event in response.get("events", []):
+		tournament = event.get("tournament", {}).get("uniqueTournament", {})
+		if tournament.get("id") == PREMIER_LEAGUE_ID:
+			matches.append(event)
+	
+	if matches:
+		logger.info(f"Found {len(matches)} Premier League matches on {date_str}")
+		for match in matches:
+			logger.info(f"- {match['homeTeam']['name']} vs {match['awayTeam']['name']}")
+	else:
+		logger.info(f"No Premier League matches found on {date_str}")
 		
-		if matches:
-			logger.info(f"Found {len(matches)} Premier League matches on {date_str}")
-			for match in matches:
-				logger.info(f"- {match['homeTeam']['name']} vs {match['awayTeam']['name']}")
-		else:
-			logger.info(f"No Premier League matches found on {date_str}")
-			
-		return matches
+	return matches
 
 async def get_match_lineups(match_id: int) -> Optional[Dict]:
 	"""
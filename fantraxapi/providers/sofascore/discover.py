@@ -19,6 +19,9 @@ USER_AGENT = "Mozilla/5.0 (analytics/lineups)"
 PREMIER_LEAGUE_ID = 17
 PREMIER_LEAGUE_NAME = "Premier League"
 
+# Connection pool shared by every request made through one client
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
 class Event:
 	"""SofaScore event."""
 	def __init__(self, **kwargs):
@@ -57,6 +60,10 @@ async def get_json(client: httpx.AsyncClient, url: str) -> dict:
 	r.raise_for_status()
 	return r.json()
 
+def make_client() -> httpx.AsyncClient:
+	"""Create an AsyncClient with pooled keep-alive connections for SofaScore."""
+	return httpx.AsyncClient(limits=HTTP_LIMITS, timeout=20)
+
 def utc_ts_to_dt(ts: int) -> datetime:
 	"""Convert SofaScore timestamp to UTC datetime."""
 	return datetime.fromtimestamp(ts, tz=timezone.utc)
@@ -216,7 +223,8 @@ async def get_scheduled_events(
 
 async def get_season_events(
 	season: str = "2025-26",
-	verbose: bool = False
+	verbose: bool = False,
+	client: Optional[httpx.AsyncClient] = None
 ) -> List[Event]:
 	"""
 	Get all Premier League events for the season.
@@ -224,10 +232,15 @@ async def get_season_events(
 	Args:
 		season: Season in format "2025-26" (defaults to 2025-26)
 		verbose: Print detailed logging
+		client: AsyncClient to reuse (a pooled one is created if omitted)
 	
 	Returns:
 		List of Event instances sorted by kickoff time
 	"""
+	if client is None:
+		async with make_client() as client:
+			return await get_season_events(season, verbose, client)
+	
 	season_start, season_end = get_season_dates(season)
 	
 	all_events = []
@@ -235,13 +248,12 @@ async def get_season_events(
 	
 	logger.info(f"\nFetching Premier League {season} season games from {season_start.date()} to {season_end.date()}")
 	
-	async with httpx.AsyncClient() as client:
-		while current_date <= season_end:
-			events = await get_scheduled_events(client, current_date, verbose)
-			all_events.extend(events)
-			current_date += timedelta(days=1)
-			# Small delay to avoid rate limiting
-			await asyncio.sleep(0.5)
+	while current_date <= season_end:
+		events = await get_scheduled_events(client, current_date, verbose)
+		all_events.extend(events)
+		current_date += timedelta(days=1)
+		# Small delay to avoid rate limiting
+		await asyncio.sleep(0.5)
 	
 	# Log raw event count before deduplication
 	raw_count = len(all_events)
@@ -288,7 +300,7 @@ async def get_watchlist(
 	all_events = []
 	current_date = date_from
 	
-	async with httpx.AsyncClient() as client:
+	async with make_client() as client:
 		while current_date <= date_to:
 			events = await get_scheduled_events(client, current_date)
 			all_events.extend(events)
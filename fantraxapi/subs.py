@@ -1,12 +1,16 @@
 # /Users/hogan/FantraxAPI/fantraxapi/subs.py
 from __future__ import annotations
 
+import gzip
+import json
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set
 
 from requests import Session
 from fantraxapi import FantraxAPI
+from fantraxapi.fantrax import _FANTRAX_PREFIX
 from fantraxapi.objs import Roster, RosterRow
 
 log = logging.getLogger(__name__)
@@ -25,6 +29,28 @@ _CODE_TO_ID = {v: k for k, v in _ID_TO_CODE.items()}	   # ints
 # player_id (scorerId) -> {'G','D','M','F'}
 _ELIG_CACHE: Dict[str, Set[str]] = {}
 
+# league_id -> (monotonic fetch time, period); the period changes at most weekly
+_PERIOD_CACHE: Dict[str, tuple] = {}
+_PERIOD_TTL = 300.0
+
+# Request bodies above this size are sent gzip-encoded (batched stats / full fieldMaps)
+_GZIP_MIN_BYTES = 1024
+
+
+def _dig(obj: Any, path: tuple) -> Any:
+	"""Walk dict keys / list indexes along ``path``; None as soon as a step is missing."""
+	for k in path:
+		if isinstance(obj, dict):
+			obj = obj.get(k)
+		elif isinstance(obj, list) and isinstance(k, int) and k < len(obj):
+			obj = obj[k]
+		else:
+			return None
+		if obj is None:
+			return None
+	return obj
+
+
 # One canonical Formation model (top-level, used everywhere)
 @dataclass(frozen=True)
 class Formation:
@@ -55,6 +81,7 @@ class SubsService:
 	def __init__(self, session: Session, league_id: str = None):
 		self.session = session
 		self.league_id = league_id
+		FantraxAPI._tune_session(session)
 
 	# -------- core plumbing --------
 	def _api(self, league_id: str) -> FantraxAPI:
@@ -70,6 +97,11 @@ class SubsService:
 		return self.get_roster(league_id, team_id).get_bench_players()
 
 	# -------- small helpers --------
+	@staticmethod
+	def _row_pid(row) -> Optional[str]:
+		p = getattr(row, "player", None)
+		return p.id if p is not None else None
+
 	@staticmethod
 	def _find_row_by_id(roster: Roster, player_id: str) -> Optional[RosterRow]:
 		for r in roster.rows:
@@ -299,7 +331,6 @@ class SubsService:
 				_ELIG_CACHE[pid] = codes
 				
 	def _fetch_and_cache_pos_from_stats(self, league_id: str, *, player_id: str, search_name: str) -> bool:
-		url = f"https://www.fantrax.com/fxpa/req?leagueId={league_id}"
 		body = {
 			"msgs": [{"method": "getPlayerStats", "data": {
 				"statusOrTeamFilter": "ALL",
@@ -308,7 +339,7 @@ class SubsService:
 			}}],"uiv": 3,"refUrl": f"https://www.fantrax.com/fantasy/league/{league_id}/players","dt": 0,"at": 0,"av": "0.0"
 		}
 		try:
-			j = self.session.post(url, json=body, timeout=20).json()
+			j = self._post_fxpa(league_id, body, timeout=20)
 			rows = j["responses"][0]["data"]["statsTable"]
 		except Exception:
 			return False
@@ -350,22 +381,25 @@ class SubsService:
 		"""
 		Warm eligibilities for *all* rows so dropdowns can include bench players.
 		"""
-		ids = [r.player.id for r in roster.rows if getattr(r, "player", None)]
+		row_pid = self._row_pid
+		ids = [pid for r in roster.rows if (pid := row_pid(r)) is not None]
 		self._ensure_codes_for_selection(league_id, roster, ids)
 
 	def warm_codes_for_roster(self, league_id: str, roster: Roster) -> None:
 		"""
 		Warm eligibilities for *all* rows so dropdowns can include bench players.
 		"""
-		ids = [r.player.id for r in roster.rows if getattr(r, "player", None)]
+		row_pid = self._row_pid
+		ids = [pid for r in roster.rows if (pid := row_pid(r)) is not None]
 		self._ensure_codes_for_selection(league_id, roster, ids)
 
 	# ---------- counts & maps ----------
 	def _pos_counts_for_ids(self, roster: Roster, player_ids: List[str]) -> Formation:
 		g = d = m = f = 0
 		idset = set(player_ids)
+		row_pid = self._row_pid
 		for r in roster.rows:
-			if getattr(r, "player", None) and r.player.id in idset and r.pos_id != "0":
+			if row_pid(r) in idset and r.pos_id != "0":
 				p = self._pos_of_row(r)
 				if p == "G": g += 1
 				elif p == "D": d += 1
@@ -374,25 +408,28 @@ class SubsService:
 		return Formation(g, d, m, f)
 
 	def _pos_counts_for_rows(self, rows: List[RosterRow], overrides: dict | None = None) -> Formation:
-		g = d = m = f = 0
+		counts = {"G": 0, "D": 0, "M": 0, "F": 0}
+		pos_of = self._pos_of_row
 		for r in rows:
 			if not getattr(r, "player", None):
 				continue
-			p = self._pos_of_row(r, overrides)
-			if p == "G": g += 1
-			elif p == "D": d += 1
-			elif p == "M": m += 1
-			elif p == "F": f += 1
-		return Formation(g, d, m, f)
+			p = pos_of(r, overrides)
+			c = counts.get(p)
+			if c is not None:
+				counts[p] = c + 1
+		return Formation(counts["G"], counts["D"], counts["M"], counts["F"])
 	
 	def _current_starter_ids(self, roster: Roster) -> List[str]:
-		return [r.player.id for r in roster.get_starters() if getattr(r, "player", None)]
+		row_pid = self._row_pid
+		return [pid for r in roster.get_starters() if (pid := row_pid(r)) is not None]
 
 	def _bench_ids(self, roster: Roster) -> List[str]:
-		return [r.player.id for r in roster.get_bench_players() if getattr(r, "player", None)]
+		row_pid = self._row_pid
+		return [pid for r in roster.get_bench_players() if (pid := row_pid(r)) is not None]
 
 	def _row_map(self, roster: Roster) -> Dict[str, RosterRow]:
-		return {r.player.id: r for r in roster.rows if getattr(r, "player", None)}
+		row_pid = self._row_pid
+		return {pid: r for r in roster.rows if (pid := row_pid(r)) is not None}
 
 	# -------- preflight (swap) --------
 	def preflight_swap(self, *, league_id: str, team_id: str, starter_player_id: str, bench_player_id: str) -> Dict[str, Any]:
@@ -418,16 +455,19 @@ class SubsService:
 		try:
 			log.info(f"[swap] Starting swap: out={out_player_id}, in={in_player_id}")
 			
+			# One snapshot for both steps
+			roster = self.get_roster(self.league_id, team_id)
+
 			# Step 1: Confirm swap
-			confirm_resp = self._confirm_swap(team_id, out_player_id, in_player_id)
-			log.info(f"[swap] Confirm response: {confirm_resp}")
+			confirm_resp = self._confirm_swap(team_id, out_player_id, in_player_id, roster=roster)
+			log.info("[swap] Confirm response: %s", confirm_resp)
 			if not confirm_resp.get('ok'):
 				log.error(f"[swap] Confirm failed: {confirm_resp}")
 				return False
 				
 			# Step 2: Execute swap
-			execute_resp = self._execute_swap(team_id, out_player_id, in_player_id)
-			log.info(f"[swap] Execute response: {execute_resp}")
+			execute_resp = self._execute_swap(team_id, out_player_id, in_player_id, roster=roster)
+			log.info("[swap] Execute response: %s", execute_resp)
 			success = execute_resp.get('ok', False)
 			if not success:
 				log.error(f"[swap] Execute failed: {execute_resp}")
@@ -436,21 +476,11 @@ class SubsService:
 			log.exception("[swap] Exception during swap")
 			return False
 
-	def _build_swap_field_map(self, team_id: str, out_id: str, in_id: str) -> dict:
-		"""Build field map for a swap operation."""
-		# Get current roster to get position IDs
-		roster = self.get_roster(self.league_id, team_id)
-		
-		# Find the rows for both players
-		out_row = None
-		in_row = None
-		for row in roster.rows:
-			if getattr(row, "player", None):
-				if row.player.id == out_id:
-					out_row = row
-				elif row.player.id == in_id:
-					in_row = row
-		
+	def _build_swap_field_map(self, roster: Roster, team_id: str, out_id: str, in_id: str) -> dict:
+		"""Build field map for a swap operation from the caller's roster snapshot."""
+		row_map = self._row_map(roster)
+		out_row = row_map.get(out_id)
+		in_row = row_map.get(in_id)
 		if not out_row or not in_row:
 			raise ValueError("Could not find both players on roster")
 		
@@ -460,12 +490,14 @@ class SubsService:
 			in_id: {"posId": int(out_row.pos_id), "stId": "1"}	# Move to active with out_row's position
 		}
 
-	def _confirm_swap(self, team_id: str, out_id: str, in_id: str) -> dict:
+	def _confirm_swap(self, team_id: str, out_id: str, in_id: str, roster: Optional[Roster] = None) -> dict:
 		"""Confirm a single player swap."""
 		if not self.league_id:
 			raise ValueError("league_id is required")
 		
-		field_map = self._build_swap_field_map(team_id, out_id, in_id)
+		if roster is None:
+			roster = self.get_roster(self.league_id, team_id)
+		field_map = self._build_swap_field_map(roster, team_id, out_id, in_id)
 		
 		# First try with current period
 		confirm_resp = self.confirm_or_execute_lineup(
@@ -499,47 +531,97 @@ class SubsService:
 		
 		return confirm_resp
 
-	def _execute_swap(self, team_id: str, out_id: str, in_id: str) -> dict:
+	def _execute_swap(self, team_id: str, out_id: str, in_id: str, roster: Optional[Roster] = None) -> dict:
 		"""Execute a confirmed player swap."""
 		if not self.league_id:
 			raise ValueError("league_id is required")
 		
-		field_map = self._build_swap_field_map(team_id, out_id, in_id)
+		if roster is None:
+			roster = self.get_roster(self.league_id, team_id)
+		field_map = self._build_swap_field_map(roster, team_id, out_id, in_id)
 		
-		# First try with current period
-		confirm_resp = self.confirm_or_execute_lineup(
+		# First try with current period (ack step only if the server asks for it)
+		confirm_resp, exec_resp = self._confirm_ack_then_execute(
 			league_id=self.league_id,
 			fantasy_team_id=team_id,
 			roster_limit_period=0,  # Let server pick period
 			apply_to_future=False,
-			do_finalize=False,  # Confirm mode
 			field_map=field_map
 		)
+		if exec_resp.get("ok"):
+			return exec_resp
 		
 		# Check response
-		model = confirm_resp.get("model", {})
+		model = (confirm_resp or exec_resp).get("model", {})
 		pick_deadline_passed = bool(model.get("playerPickDeadlinePassed"))
 		current_period = int(model.get("rosterLimitPeriod", 0))
-		first_illegal_period = model.get("firstIllegalRosterPeriod")
 		
-		# Determine target period and flags
-		target_period = current_period
-		apply_to_future = False
+		if not (pick_deadline_passed and current_period > 0):
+			return exec_resp
 		
-		if pick_deadline_passed and current_period > 0:
-			target_period = current_period + 1
-			apply_to_future = True
-			log.info(f"[swap] Deadline passed for period {current_period}, executing for period {target_period}")
-		
-		# Execute with appropriate period and flags
-		return self.confirm_or_execute_lineup(
+		# Deadline passed: execute for the next period
+		target_period = current_period + 1
+		log.info(f"[swap] Deadline passed for period {current_period}, executing for period {target_period}")
+		_, exec_resp = self._confirm_ack_then_execute(
 			league_id=self.league_id,
 			fantasy_team_id=team_id,
 			roster_limit_period=target_period,
-			apply_to_future=apply_to_future,
-			do_finalize=True,  # Execute mode
+			apply_to_future=True,
 			field_map=field_map
 		)
+		return exec_resp
+
+	@staticmethod
+	def _needs_ack(resp: Dict[str, Any]) -> bool:
+		"""True if a finalize response asks for the confirm (ack) round before executing."""
+		fr = resp.get("fantasyResponse") or {}
+		model = resp.get("model") or {}
+		return bool(
+			fr.get("msgType") == "WARNING"
+			or fr.get("showConfirmWindow")
+			or model.get("firstIllegalRosterPeriod")
+		)
+
+	def _confirm_ack_then_execute(
+		self,
+		*,
+		league_id: str,
+		fantasy_team_id: str,
+		roster_limit_period: int,
+		field_map: Dict[str, Dict[str, int]],
+		apply_to_future: bool,
+	) -> tuple:
+		"""
+		Finalize directly; fall back to confirm -> finalize (one batched request)
+		only when the server asks for it (see _needs_ack). Returns
+		(precheck or None, finalize).
+		"""
+		kwargs = dict(
+			league_id=league_id,
+			fantasy_team_id=fantasy_team_id,
+			roster_limit_period=roster_limit_period,
+			field_map=field_map,
+			apply_to_future=apply_to_future,
+		)
+		fin = self.confirm_or_execute_lineup(do_finalize=True, **kwargs)
+		if not self._needs_ack(fin):
+			return None, fin
+		pre, fin = self.apply_lineup_atomic(**kwargs)
+		return pre, (fin if fin is not None else pre)
+
+	@staticmethod
+	def _needs_throttle(*responses: Optional[Dict[str, Any]]) -> bool:
+		"""True if any lineup response carries a back-off signal (WARNING, retryAfter, HTTP 429)."""
+		for r in responses:
+			if not isinstance(r, dict):
+				continue
+			fr = r.get("fantasyResponse") or {}
+			raw = r.get("raw") if isinstance(r.get("raw"), dict) else {}
+			if fr.get("msgType") == "WARNING" or fr.get("retryAfter") is not None:
+				return True
+			if raw.get("http_status") == 429 or raw.get("retryAfter") is not None:
+				return True
+		return False
 
 	# ---------- Validation (full XI) ----------
 	def set_lineup_by_ids(
@@ -578,43 +660,38 @@ class SubsService:
 		api = self._api(league_id)
 		ftid = fantasy_team_id or team_id
 
-		def _apply_two_step(field_map, future, *, do_finalize: bool):
-			return self.confirm_or_execute_lineup(
+		def _apply_two_step(field_map, future):
+			return self._confirm_ack_then_execute(
 				league_id=league_id,
 				fantasy_team_id=ftid,
 				roster_limit_period=0,	 # <-- always 0
 				field_map=field_map,
 				apply_to_future=future,
-				do_finalize=do_finalize,
 			)
 
-		import time, random
+		import random
 		results: List[Dict[str, Any]] = []
 		warnings: List[str] = []
 		errors: List[str] = []
 
+		# Starter set is tracked locally after each finalize; the roster is only
+		# re-read for ground truth on verify or after an exception.
+		roster_now: Optional[Roster] = None
+		starters_state: Optional[Set[str]] = None
+
 		for (out_id, in_id) in pre["plan"]:
 			try:
-				# Fresh snapshot before each swap
-				roster_now = api.roster_info(team_id)
-				current_starters = set(self._current_starter_ids(roster_now))
+				# Fresh snapshot before each swap (reuses the verify snapshot when there is one)
+				if roster_now is None:
+					roster_now = api.roster_info(team_id)
+				if starters_state is None:
+					starters_state = set(self._current_starter_ids(roster_now))
 
 				# ---- Phase A: Promote 'in' (12 actives) ----
-				starters_A = set(current_starters)
-				starters_A.add(in_id)
-				fmap_A = self.build_field_map(roster_now, list(starters_A), pos_overrides)
-
-				pre_A  = _apply_two_step(fmap_A, apply_to_future, do_finalize=False)
+				fmap_A = self.build_field_map(roster_now, list(starters_state | {in_id}), pos_overrides)
 
-				# If deadline passed / not allowed, retarget future period
-				model_A = pre_A.get("model") or {}
-				change_allowed = bool(model_A.get("changeAllowed", True))
-				pick_deadline_passed = bool(model_A.get("playerPickDeadlinePassed"))
-				first_illegal_period = model_A.get("firstIllegalRosterPeriod")
-
-				auto_future_A = False
-
-				fin_A  = _apply_two_step(fmap_A, apply_to_future, do_finalize=True)
+				# pre_A is None when the server accepted the finalize without asking for an ack
+				pre_A, fin_A = _apply_two_step(fmap_A, apply_to_future)
 
 				ok_A = bool(fin_A.get("ok"))
 
@@ -628,32 +705,20 @@ class SubsService:
 					if not best_effort:
 						break
 					# Skip Phase B if A failed; continue to next swap
-					time.sleep(0.6 + random.random() * 0.4)
+					roster_now = None
+					if self._needs_throttle(pre_A, fin_A):
+						time.sleep(0.3 + random.random() * 0.2)
 					continue
+				starters_state.add(in_id)
 
 				# ---- Phase B: Demote 'out' (back to 11) ----
 				# Refresh snapshot to build an accurate full fieldMap
-				time.sleep(0.3)
+				if self._needs_throttle(pre_A, fin_A):
+					time.sleep(0.3 + random.random() * 0.2)
 				roster_mid = api.roster_info(team_id)
-				current_after_A = set(self._current_starter_ids(roster_mid))
-				starters_B = set(current_after_A)
-				if out_id in starters_B:
-					starters_B.remove(out_id)
-				# Ensure 'in' remains starter
-				starters_B.add(in_id)
-
-				fmap_B = self.build_field_map(roster_mid, list(starters_B), pos_overrides)
-
-				pre_B  = _apply_two_step(fmap_B, apply_to_future, do_finalize=False)
+				fmap_B = self.build_field_map(roster_mid, list(starters_state - {out_id}), pos_overrides)
 
-				model_B = (pre_B.get("model") or {})
-				change_allowed_B = bool(model_B.get("changeAllowed", True))
-				pick_deadline_passed_B = bool(model_B.get("playerPickDeadlinePassed"))
-				first_illegal_period_B = model_B.get("firstIllegalRosterPeriod")
-
-				auto_future_B = False
-
-				fin_B  = _apply_two_step(fmap_B, apply_to_future, do_finalize=True)
+				pre_B, fin_B = _apply_two_step(fmap_B, apply_to_future)
 
 				ok_B = bool(fin_B.get("ok"))
 
@@ -662,14 +727,22 @@ class SubsService:
 					if fin_B.get("mainMsg"): err_B.append(str(fin_B["mainMsg"]))
 					for m in (fin_B.get("illegalMsgs") or []): err_B.append(str(m))
 					if not err_B: err_B.append("Phase B (demote) failed.")
+				else:
+					starters_state.discard(out_id)
 
 				# Verify final state of this swap
 				verified = None
+				roster_now = None
 				if ok_B and verify_each:
 					try:
-						time.sleep(0.4)
 						roster_after = api.roster_info(team_id)
 						cur_ids = set(self._current_starter_ids(roster_after))
+						if in_id not in cur_ids:
+							# Possibly stale read; retry once
+							time.sleep(0.4)
+							roster_after = api.roster_info(team_id)
+							cur_ids = set(self._current_starter_ids(roster_after))
+						roster_now, starters_state = roster_after, cur_ids
 						verified = (in_id in cur_ids) and (out_id not in cur_ids)
 						if not verified:
 							ok_B = False
@@ -677,7 +750,7 @@ class SubsService:
 					except Exception as ve:
 						warnings.append(f"Swap applied but verify failed: {ve}")
 
-				server_period = ((pre_B.get("model") or {}).get("rosterAdjustmentInfo") or {}).get("rosterLimitPeriod")
+				server_period = (((pre_B or fin_B).get("model") or {}).get("rosterAdjustmentInfo") or {}).get("rosterLimitPeriod")
 				if server_period is not None:
 					warnings.append(f"Server scheduled change to period {server_period}.")  # info only
 
@@ -695,10 +768,12 @@ class SubsService:
 				if not ok_B and not best_effort:
 					break
 
-				# polite throttle
-				time.sleep(0.6 + random.random() * 0.4)
+				# back off only when the server signalled it
+				if self._needs_throttle(pre_A, fin_A, pre_B, fin_B):
+					time.sleep(0.3 + random.random() * 0.2)
 
 			except Exception as e:
+				roster_now, starters_state = None, None
 				results.append({"out": out_id, "in": in_id, "phase": "exception", "ok": False, "verified": None, "precheck": None, "finalize": None, "error": str(e)})
 				errors.append(str(e))
 				if not best_effort:
@@ -707,7 +782,9 @@ class SubsService:
 		# Final summary
 		try:
 			final_roster = api.roster_info(team_id)
-			selected_rows = [r for r in final_roster.rows if getattr(r, "player", None) and r.player.id in set(desired_starter_ids)]
+			desired_set = set(desired_starter_ids)
+			row_pid = self._row_pid
+			selected_rows = [r for r in final_roster.rows if row_pid(r) in desired_set]
 			desired_counts = self._pos_counts_for_rows(selected_rows, pos_overrides)
 			final_starters = self._current_starter_ids(final_roster)
 		except Exception as e:
@@ -835,91 +912,71 @@ class SubsService:
 		if not to_add and not to_remove:
 			return []
 
-		def _movable(pid: str) -> bool:
-			return True if not ensure_unlocked else not self._row_locked(row_map.get(pid))
-
 		cur = self._pos_counts_for_rows([row_map[pid] for pid in current_starters], pos_overrides)
 		target = self._pos_counts_for_rows([row_map[pid] for pid in desired_starter_ids], pos_overrides)
 
-		def _pos(pid: str) -> str:
-			return self._pos_of_row(row_map[pid], pos_overrides)
-
+		# Locked players can't take part in any swap, so drop them up front
+		# instead of discarding a whole (out, in) pair when one side is locked.
+		# Every remaining pairing then costs the same and the count-based
+		# drain below is an exact minimum matching.
+		pos_of = self._pos_of_row
+		row_locked = self._row_locked if ensure_unlocked else None
 		add_by_pos = {"G": [], "D": [], "M": [], "F": []}
 		rem_by_pos = {"G": [], "D": [], "M": [], "F": []}
-		for pid in to_add: add_by_pos[_pos(pid)].append(pid)
-		for pid in to_remove: rem_by_pos[_pos(pid)].append(pid)
+		for ids, buckets in ((to_add, add_by_pos), (to_remove, rem_by_pos)):
+			for pid in ids:
+				row = row_map[pid]
+				bucket = buckets.get(pos_of(row, pos_overrides))
+				if bucket is None:
+					continue
+				if row_locked and row_locked(row):
+					warnings.append(f"Skipped {row.player.name}: locked.")
+					continue
+				bucket.append(pid)
 
 		plan: List[tuple] = []
+		plan_append = plan.append
 
 		# (1) same-position swaps
 		for p in ("G", "D", "M", "F"):
-			while add_by_pos[p] and rem_by_pos[p]:
-				inn = add_by_pos[p].pop()
-				out = rem_by_pos[p].pop()
-				if not (_movable(inn) and _movable(out)):
-					warnings.append(f"Skipped swap {row_map.get(out).player.name} ↔ {row_map.get(inn).player.name} due to lock.")
-					continue
-				plan.append((out, inn))
+			rem, add = rem_by_pos[p], add_by_pos[p]
+			while add and rem:
+				plan_append((rem.pop(), add.pop()))
 
-		def _surplus(c: Formation, t: Formation) -> List[str]:
-			return ([p for p, diff in (("D", c.d - t.d), ("M", c.m - t.m), ("F", c.f - t.f)) if diff > 0])
-
-		def _deficit(c: Formation, t: Formation) -> List[str]:
-			return ([p for p, diff in (("D", t.d - c.d), ("M", t.m - c.m), ("F", t.f - c.f)) if diff > 0])
+		# Outfield counts still to move, as plain per-code ints; GK balancing
+		# below shifts one slot in place instead of recounting.
+		cur_n = {"D": cur.d, "M": cur.m, "F": cur.f}
+		tgt_n = {"D": target.d, "M": target.m, "F": target.f}
 
 		# GK balancing (works if target.gk == 0 or 1)
 		if cur.gk != target.gk:
 			if cur.gk > target.gk and rem_by_pos["G"]:
-				def_pos = _deficit(cur, target)
-				picked_in = next((add_by_pos[p].pop() for p in def_pos if add_by_pos[p]), None)
-				if picked_in:
-					out = rem_by_pos["G"].pop()
-					if _movable(picked_in) and _movable(out):
-						plan.append((out, picked_in))
-			elif cur.gk < target.gk and add_by_pos["G"] and (rem_by_pos["D"] or rem_by_pos["M"] or rem_by_pos["F"]):
-				surplus = _surplus(cur, target) or ["D", "M", "F"]
-				picked_out = next((rem_by_pos[p].pop() for p in surplus if rem_by_pos[p]), None)
-				if picked_out:
-					inn = add_by_pos["G"].pop()
-					if _movable(inn) and _movable(picked_out):
-						plan.append((picked_out, inn))
-
-		# Outfield balancing loop
-		safety = 100
-		while safety > 0 and (cur.d != target.d or cur.m != target.m or cur.f != target.f):
-			safety -= 1
-			sur = _surplus(cur, target)
-			defc = _deficit(cur, target)
-			if not sur or not defc:
-				break
-			took = False
-			for p_out in sur:
-				if not rem_by_pos[p_out]:
-					continue
-				for p_in in defc:
-					if not add_by_pos[p_in]:
-						continue
-					out = rem_by_pos[p_out][-1]
-					inn = add_by_pos[p_in][-1]
-					if not (_movable(out) and _movable(inn)):
-						rem_by_pos[p_out].pop()
-						add_by_pos[p_in].pop()
-						continue
-					rem_by_pos[p_out].pop(); add_by_pos[p_in].pop()
-					plan.append((out, inn))
-					took = True
+				p_in = next((p for p in ("D", "M", "F") if tgt_n[p] > cur_n[p] and add_by_pos[p]), None)
+				if p_in:
+					plan_append((rem_by_pos["G"].pop(), add_by_pos[p_in].pop()))
+					cur_n[p_in] += 1
+			elif cur.gk < target.gk and add_by_pos["G"]:
+				surplus = [p for p in ("D", "M", "F") if cur_n[p] > tgt_n[p]] or ["D", "M", "F"]
+				p_out = next((p for p in surplus if rem_by_pos[p]), None)
+				if p_out:
+					plan_append((rem_by_pos[p_out].pop(), add_by_pos["G"].pop()))
+					cur_n[p_out] -= 1
+
+		# Outfield balancing: exact swap count per (p_out, p_in), bounded by
+		# the total deficit.
+		surplus_n = {p: cur_n[p] - tgt_n[p] for p in ("D", "M", "F") if cur_n[p] > tgt_n[p]}
+		deficit_n = {p: tgt_n[p] - cur_n[p] for p in ("D", "M", "F") if tgt_n[p] > cur_n[p]}
+		for p_out, n_out in surplus_n.items():
+			rem = rem_by_pos[p_out]
+			for p_in in deficit_n:
+				add = add_by_pos[p_in]
+				k = min(n_out, deficit_n[p_in], len(rem), len(add))
+				for _ in range(k):
+					plan_append((rem.pop(), add.pop()))
+				n_out -= k
+				deficit_n[p_in] -= k
+				if not n_out:
 					break
-				if took:
-					break
-
-		# (3) cleanup
-		for p in ("D", "M", "F", "G"):
-			while add_by_pos[p] and rem_by_pos[p]:
-				inn = add_by_pos[p].pop(); out = rem_by_pos[p].pop()
-				if not (_movable(inn) and _movable(out)):
-					warnings.append(f"Skipped final same-pos swap due to locks: {row_map.get(out).player.name} ↔ {row_map.get(inn).player.name}")
-					continue
-				plan.append((out, inn))
 
 		return plan
 	
@@ -931,41 +988,35 @@ class SubsService:
 		desired_starter_ids: List[str],
 		pos_overrides: Optional[Dict[str, str]] = None,
 		accept_warnings: bool = True,
+		return_raw: bool = True,
 	) -> Dict[str, Any]:
 		"""
 		Apply XI using Fantrax 'confirmOrExecuteTeamRosterChanges' with fieldMap.
 		pos_overrides: {scorerId: 'G'|'D'|'M'|'F'} for chosen bucket; others on roster go to bench (0).
+		return_raw: set False to drop the (large) decoded response from the result once ok/page_error are read.
 		"""
-		api_url = f"https://www.fantrax.com/fxpa/req?leagueId={league_id}"
 		roster = self.get_roster(league_id, team_id)
 		row_map = self._row_map(roster)
 
 		# Build fieldMap scorerId -> posId (0 bench, 701 F, 702 M, 703 D, 704 G)
-		code_to_id = {"F": 701, "M": 702, "D": 703, "G": 704}
-		want = set(desired_starter_ids)
 		field_map: Dict[str, Dict[str, int]] = {}
 
 		# starters with chosen buckets
 		for pid in desired_starter_ids:
-			code = None
 			if pos_overrides and pid in pos_overrides:
 				code = pos_overrides[pid]
 			else:
 				# derive from eligibility / current slot
 				code = self._pos_of_row(row_map[pid])
-			pos_id = code_to_id.get(code, None)
+			pos_id = _CODE_TO_ID.get(code)
 			if pos_id is None:
 				raise RuntimeError(f"Cannot determine posId for {pid} ({code})")
 			field_map[pid] = {"posId": pos_id}
 
 		# everyone else on bench
-		for r in roster.rows:
-			if not getattr(r, "player", None):
-				continue
-			pid = r.player.id
-			if pid in field_map:
-				continue
-			field_map[pid] = {"posId": 0}
+		for pid in row_map:
+			if pid not in field_map:
+				field_map[pid] = {"posId": 0}
 
 		msg = {
 			"method": "confirmOrExecuteTeamRosterChanges",
@@ -979,37 +1030,38 @@ class SubsService:
 		body = {"msgs": [msg], "uiv": 3, "refUrl": f"https://www.fantrax.com/fantasy/league/{league_id}/lineup", "dt": 0, "at": 0, "av": "0.0"}
 
 		log.info(f"[subs] fieldMap size={len(field_map)} starters={len(desired_starter_ids)}")
-		resp = self.session.post(api_url, json=body, timeout=30)
-		try:
-			j = resp.json()
-		except Exception:
-			j = {"http_status": resp.status_code, "text": resp.text[:800]}
+		j = self._post_fxpa(league_id, body)
 
 		# Try to pick out confirm/tx responses
-		ok = False
-		page_error = None
-		try:
-			if isinstance(j, dict) and j.get("responses"):
-				r0 = j["responses"][0].get("data") or {}
-				page_error = r0.get("pageError")
-				tx = (r0.get("txResponses") or [None])[0] or {}
-				code = (tx.get("code") or "").lower()
-				ok = (not page_error) and code.startswith("ok")
-		except Exception:
-			pass
+		page_error = _dig(j, ("responses", 0, "data", "pageError"))
+		code = str(_dig(j, ("responses", 0, "data", "txResponses", 0, "code")) or "").lower()
+		ok = (not page_error) and code.startswith("ok")
 
-		log.info(f"[subs] fieldMap apply ok={ok} page_error={page_error} raw={j}")
-		return {"ok": bool(ok), "raw": j, "page_error": page_error}
+		log.info("[subs] fieldMap apply ok=%s page_error=%s", ok, page_error)
+		log.debug("[subs] fieldMap apply raw=%s", j)
+		return {"ok": bool(ok), "raw": j if return_raw else None, "page_error": page_error}
 
 	# ---------- Execute (full XI) ----------
 	def get_current_period(self, league_id: str) -> Optional[int]:
 		"""
 		Server-reported current 'period' (aka gameweek). Safe fallback if not present in roster payloads.
+		Cached per league for _PERIOD_TTL seconds; failures are not cached.
 		"""
+		now = time.monotonic()
+		hit = _PERIOD_CACHE.get(league_id)
+		if hit and now - hit[0] < _PERIOD_TTL:
+			return hit[1]
 		try:
-			return self._api(league_id).drops.get_current_period()
+			period = self._api(league_id).drops.get_current_period()
 		except Exception:
 			return None
+		_PERIOD_CACHE[league_id] = (now, period)
+		return period
+
+	@staticmethod
+	def invalidate_period(league_id: str) -> None:
+		"""Drop the cached current period for a league (e.g. after a future-period change)."""
+		_PERIOD_CACHE.pop(league_id, None)
 
 	def build_field_map(self, roster: Roster, desired_starter_ids: List[str], pos_overrides: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, int | str]]:
 		"""
@@ -1018,53 +1070,76 @@ class SubsService:
 		- Starters (in desired_starter_ids) get stId="1", everyone else "2".
 		- posId derived from current/effective G/D/M/F (honoring overrides when provided).
 		"""
-		pos_overrides = pos_overrides or {}
 		want = set(desired_starter_ids)
-		fmap: Dict[str, Dict[str, int | str]] = {}
+		ids, slot_ids = self._roster_slot_ids(roster)
+		if pos_overrides:
+			code_to_id = _CODE_TO_ID.get
+			slot_ids = [
+				(code_to_id(pos_overrides[pid]) or pos_id) if pid in pos_overrides else pos_id
+				for pid, pos_id in zip(ids, slot_ids)
+			]
+		# starter: real slot id (701/702/703/704); bench: ALWAYS 0.
+		# Unresolved rows are skipped so the server keeps their current state.
+		return {
+			pid: {"posId": pos_id, "stId": "1"} if pid in want else {"posId": 0, "stId": "2"}
+			for pid, pos_id in zip(ids, slot_ids)
+			if pos_id
+		}
 
-		for r in roster.rows:
-			if not getattr(r, "player", None):
-				continue
-			pid = r.player.id
-			# Figure the code for this row
-			code = pos_overrides.get(pid) if pid in pos_overrides else self._pos_of_row(r, pos_overrides)
-			pos_id = _CODE_TO_ID.get(code)
-			if not pos_id:
-				elig = SubsService.eligible_positions_of_row(r)
-				code2 = next(iter(elig)) if elig else None
-				pos_id = _CODE_TO_ID.get(code2 or "")
-			if not pos_id:
-				# If unresolved, skip; server will keep current state for this row
-				continue
-			is_starter = pid in want
-			if is_starter:
-				# starter: real slot id (701/702/703/704)
-				fmap[pid] = {"posId": int(pos_id), "stId": "1"}
-			else:
-				# bench: ALWAYS 0
-				fmap[pid] = {"posId": 0, "stId": "2"}
-		return fmap
+	def _roster_slot_ids(self, roster: Roster) -> tuple:
+		"""
+		(player ids, default slot ids) for every player row, resolved once per
+		Roster snapshot and kept on it. Unresolved rows (None) are retried on
+		each call, since the eligibility cache may have been warmed since.
+		"""
+		cached = getattr(roster, "_slot_ids", None)
+		if cached is None:
+			rows = [r for r in roster.rows if self._row_pid(r) is not None]
+			cached = (
+				[r.player.id for r in rows],
+				[_CODE_TO_ID.get(self._pos_of_row(r)) for r in rows],
+				rows,
+			)
+			roster._slot_ids = cached
+		ids, slot_ids, rows = cached
+		for i, pos_id in enumerate(slot_ids):
+			if pos_id is None:
+				slot_ids[i] = _CODE_TO_ID.get(self._pos_of_row(rows[i]))
+		return ids, slot_ids
 
-	def _post_fxpa(self, league_id: str, body: dict) -> dict:
-		url = f"https://www.fantrax.com/fxpa/req?leagueId={league_id}"
+	def _post_fxpa(self, league_id: str, body: dict, *, timeout: float = 30) -> dict:
+		"""
+		Single POST path for every FXPA call in this module.
+		Large bodies are gzip-compressed (FXPA accepts Content-Encoding: gzip).
+		"""
+		url = f"{_FANTRAX_PREFIX}/fxpa/req?leagueId={league_id}"
+		payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+		headers = {"Content-Type": "application/json"}
+		if len(payload) > _GZIP_MIN_BYTES:
+			payload = gzip.compress(payload, compresslevel=3)
+			headers["Content-Encoding"] = "gzip"
 		try:
-			res = self.session.post(url, json=body, timeout=30)
-			return res.json()
+			res = self.session.post(url, data=payload, headers=headers, timeout=timeout)
 		except Exception as e:
 			return {"error": str(e)}
+		if res.status_code == 429:
+			return {"error": "rate limited", "http_status": 429, "retryAfter": res.headers.get("Retry-After")}
+		try:
+			return res.json()
+		except Exception:
+			return {"error": "invalid JSON", "http_status": res.status_code, "text": res.text[:800]}
 
-	def confirm_or_execute_lineup(
-		self,
+	@staticmethod
+	def _lineup_change_msg(
 		*,
-		league_id: str,
 		fantasy_team_id: str,
 		roster_limit_period: int,
 		field_map: Dict[str, Dict[str, int]],
 		apply_to_future: bool,
 		do_finalize: bool,
 	) -> Dict[str, Any]:
-		# --- request payload ---
-		data_common = {
+		"""One confirmOrExecuteTeamRosterChanges entry for the FXPA ``msgs`` list."""
+		data = {
 			"rosterLimitPeriod": int(roster_limit_period),
 			"fantasyTeamId": fantasy_team_id,
 			"teamId": fantasy_team_id,
@@ -1074,63 +1149,106 @@ class SubsService:
 			"fieldMap": field_map,
 		}
 		if not do_finalize:
-			data = dict(data_common)
 			data["confirm"] = True
 			data["action"] = "CONFIRM"	   # <-- important
 		else:
-			data = dict(data_common)
 			data["acceptWarnings"] = True
 			data["action"] = "EXECUTE"	   # <-- important
+		return {"method": "confirmOrExecuteTeamRosterChanges", "data": data}
 
-		body = {
-			"msgs": [{"method": "confirmOrExecuteTeamRosterChanges", "data": data}],
+	@staticmethod
+	def _lineup_body(league_id: str, msgs: List[Dict[str, Any]]) -> Dict[str, Any]:
+		return {
+			"msgs": msgs,
 			"uiv": 3,
 			"refUrl": f"https://www.fantrax.com/fantasy/league/{league_id}/team/roster",
 			"dt": 0, "at": 0, "av": "0.0",
 		}
 
-		j = self._post_fxpa(league_id, body)
+	def confirm_or_execute_lineup(
+		self,
+		*,
+		league_id: str,
+		fantasy_team_id: str,
+		roster_limit_period: int,
+		field_map: Dict[str, Dict[str, int]],
+		apply_to_future: bool,
+		do_finalize: bool,
+	) -> Dict[str, Any]:
+		msg = self._lineup_change_msg(
+			fantasy_team_id=fantasy_team_id,
+			roster_limit_period=roster_limit_period,
+			field_map=field_map,
+			apply_to_future=apply_to_future,
+			do_finalize=do_finalize,
+		)
+		j = self._post_fxpa(league_id, self._lineup_body(league_id, [msg]))
+		res = self._parse_lineup_response(j, 0, do_finalize=do_finalize)
+		if do_finalize and apply_to_future and res["ok"]:
+			self.invalidate_period(league_id)
+		return res
 
-		# --- parse both shapes: fantasyResponse + txResponses ---
-		resp0 = (j.get("responses") or [{}])[0] if isinstance(j, dict) else {}
-		data_blob = resp0.get("data") or {}
-		page_error = resp0.get("pageError") or data_blob.get("pageError")
+	def apply_lineup_atomic(
+		self,
+		*,
+		league_id: str,
+		fantasy_team_id: str,
+		roster_limit_period: int,
+		field_map: Dict[str, Dict[str, int]],
+		apply_to_future: bool,
+	) -> tuple:
+		"""
+		Confirm + execute in one FXPA round-trip (two entries in ``msgs``).
+		Returns (precheck, finalize) in the confirm_or_execute_lineup shape;
+		finalize is None when the precheck was not ok.
+		"""
+		kwargs = dict(
+			fantasy_team_id=fantasy_team_id,
+			roster_limit_period=roster_limit_period,
+			field_map=field_map,
+			apply_to_future=apply_to_future,
+		)
+		msgs = [
+			self._lineup_change_msg(do_finalize=False, **kwargs),
+			self._lineup_change_msg(do_finalize=True, **kwargs),
+		]
+		j = self._post_fxpa(league_id, self._lineup_body(league_id, msgs))
+		pre = self._parse_lineup_response(j, 0, do_finalize=False)
+		if not pre["ok"]:
+			return pre, None
+		fin = self._parse_lineup_response(j, 1, do_finalize=True)
+		if apply_to_future and fin["ok"]:
+			self.invalidate_period(league_id)
+		return pre, fin
 
+	@staticmethod
+	def _parse_lineup_response(j: Any, index: int, *, do_finalize: bool) -> Dict[str, Any]:
+		# --- parse both shapes: fantasyResponse + txResponses ---
+		data_blob = _dig(j, ("responses", index, "data")) or {}
+		page_error = _dig(j, ("responses", index, "pageError")) or data_blob.get("pageError")
 		fr = data_blob.get("fantasyResponse") or {}
-		ta = data_blob.get("textArray") or {}
-		model = (ta.get("model") or {}) if isinstance(ta, dict) else {}
-
-		tx = (data_blob.get("txResponses") or [])
-		tx_ok = False
-		tx_code = None
-		tx_msg  = None
-		if tx:
-			t0 = tx[0] or {}
-			tx_code = (t0.get("code") or "").upper()
-			status  = (t0.get("status") or "").upper()
-			tx_msg  = t0.get("message")
-			# e.g. OK_SUCCESS / SUCCEEDED / SUCCESS / OK
-			tx_ok = tx_code.startswith("OK") or status in {"SUCCEEDED", "SUCCESS", "OK"}
+		model = _dig(data_blob, ("textArray", "model")) or {}
+
+		t0 = _dig(data_blob, ("txResponses", 0)) or {}
+		tx_msg = t0.get("message")
+		# e.g. OK_SUCCESS / SUCCEEDED / SUCCESS / OK
+		tx_ok = bool(t0) and (
+			(t0.get("code") or "").upper().startswith("OK")
+			or (t0.get("status") or "").upper() in {"SUCCEEDED", "SUCCESS", "OK"}
+		)
 
 		msg_type = fr.get("msgType")
 		show_confirm = bool(fr.get("showConfirmWindow"))
-		illegal = list(fr.get("illegalRosterMsgs") or [])
+		# Read-only: the server's list as-is, or an empty tuple (no copies)
+		illegal = fr.get("illegalRosterMsgs") or model.get("illegalRosterMsgs") or ()
 		main_msg = fr.get("mainMsg") or tx_msg
 
-		# Success rules:
-		# - PRE: CONFIRM/WARNING/SUCCESS OR tx_ok
-		# - FIN: SUCCESS/CONFIRM/WARNING OR tx_ok
-		if do_finalize:
-			ok_flag = (msg_type in ("SUCCESS", "CONFIRM", "WARNING")) or tx_ok
-		else:
-			ok_flag = (msg_type in ("CONFIRM", "WARNING", "SUCCESS")) or tx_ok
-
-		if page_error:
-			ok_flag = False
+		# Success rule (PRE and FIN alike): CONFIRM/WARNING/SUCCESS OR tx_ok, no pageError
+		ok_flag = not page_error and (msg_type in ("SUCCESS", "CONFIRM", "WARNING") or tx_ok)
 
 		log.info(
 			"[lineup] finalize=%s type=%s confirmWindow=%s illegal=%s",
-			do_finalize, msg_type, show_confirm, illegal or None
+			do_finalize, msg_type, show_confirm, illegal
 		)
 		log.info(
 			"[lineup] changeAllowed=%s firstIllegalPeriod=%s pickDeadlinePassed=%s",
@@ -1140,7 +1258,7 @@ class SubsService:
 		)
 
 		# Helpful dump if FR missing and no txResponses
-		if msg_type is None and not tx:
+		if msg_type is None and not t0:
 			log.info("[lineup] raw response (truncated): %s", str(j)[:800])
 
 		return {
@@ -1,8 +1,12 @@
-from typing import List
+from typing import Dict, List
 
 from .exceptions import FantraxException
 from .objs import Trade, TradeBlock
 
+# Shared type payloads for submitTrade rows (serialized only, never mutated)
+_TRADE_TYPE = {"code": "TRADE", "name": "Trade"}
+_DROP_TYPE = {"code": "DROP", "name": "Drop"}
+
 
 class TradesService:
 	"""Feature module for trade-related operations.
@@ -76,57 +80,35 @@ class TradesService:
 				player_ids_to_receive=["def456"]
 			)
 		"""
-		transactions = []
-
-		# Add your outgoing players
-		if player_ids_to_give:
-			for player_id in player_ids_to_give:
-				transactions.append({
-					"destinationTeamId": to_team_id,
-					"sourceTeamId": from_team_id,
-					"scorerId": player_id,
-					"type": {"code": "TRADE", "name": "Trade"}
-				})
-
-		# Add their players you want
-		if player_ids_to_receive:
-			for player_id in player_ids_to_receive:
-				transactions.append({
-					"destinationTeamId": from_team_id,
-					"sourceTeamId": to_team_id,
-					"scorerId": player_id,
-					"type": {"code": "TRADE", "name": "Trade"}
-				})
-
-		# Add FAAB if included
+		# (source, destination, scorerId) per asset: players first, then FAAB
+		# as a BA_<amount> scorer
+		legs = [(from_team_id, to_team_id, pid) for pid in (player_ids_to_give or ())]
+		legs += [(to_team_id, from_team_id, pid) for pid in (player_ids_to_receive or ())]
 		if faab_to_give:
-			transactions.append({
-				"destinationTeamId": to_team_id,
-				"sourceTeamId": from_team_id,
-				"scorerId": f"BA_{faab_to_give}",
-				"type": {"code": "TRADE", "name": "Trade"}
-			})
+			legs.append((from_team_id, to_team_id, f"BA_{faab_to_give}"))
 		if faab_to_receive:
-			transactions.append({
-				"destinationTeamId": from_team_id,
-				"sourceTeamId": to_team_id,
-				"scorerId": f"BA_{faab_to_receive}",
-				"type": {"code": "TRADE", "name": "Trade"}
-			})
+			legs.append((to_team_id, from_team_id, f"BA_{faab_to_receive}"))
+		transactions = [
+			{"destinationTeamId": dst, "sourceTeamId": src, "scorerId": pid, "type": _TRADE_TYPE}
+			for src, dst, pid in legs
+		]
 
 		if not transactions:
 			raise FantraxException("Trade must include at least one asset (players or FAAB)")
 
 		# Add conditional drops if specified
 		if conditional_drops:
-			for incoming_id, drop_id in conditional_drops.items():
-				transactions.append({
-					"type": {"code": "DROP", "name": "Drop"},
+			receiving = set(player_ids_to_receive or ())
+			transactions.extend(
+				{
+					"type": _DROP_TYPE,
 					"scorerId": drop_id,
-					"sourceTeamId": from_team_id if incoming_id in (player_ids_to_receive or []) else to_team_id,
+					"sourceTeamId": from_team_id if incoming_id in receiving else to_team_id,
 					"conditional": True,
 					"conditionalOnScorerId": incoming_id
-				})
+				}
+				for incoming_id, drop_id in conditional_drops.items()
+			)
 
 		# Submit the trade
 		response = self._request("submitTrade", transactions=transactions)
@@ -155,10 +137,25 @@ class TradesService:
 			trade_id: The ID of the trade to check
 		"""
 		response = self._request("getPendingTransactions", txSetId=trade_id)
-		if "tradeInfoList" in response:
-			for trade in response["tradeInfoList"]:
-				if trade["txSetId"] == trade_id:
-					return trade
-		raise FantraxException(f"Trade {trade_id} not found")
+		trade = self._index_trades(response).get(trade_id)
+		if trade is None:
+			raise FantraxException(f"Trade {trade_id} not found")
+		return trade
+
+	def get_trade_details_bulk(self, trade_ids: List[str]) -> Dict[str, dict]:
+		"""Get details for several trades with a single getPendingTransactions call.
+
+		Args:
+			trade_ids: The IDs of the trades to check
+
+		Returns:
+			dict: trade_id -> trade details, for the ids that are still pending
+		"""
+		by_id = self._index_trades(self._request("getPendingTransactions"))
+		return {tid: by_id[tid] for tid in trade_ids if tid in by_id}
+
+	@staticmethod
+	def _index_trades(response: dict) -> Dict[str, dict]:
+		return {t["txSetId"]: t for t in response.get("tradeInfoList") or []}
 
 
@@ -1,7 +1,15 @@
+import threading
+import time
+from concurrent.futures import Future
+from itertools import islice, takewhile
 from typing import Optional, Dict, Any, List
 
 from .exceptions import FantraxException
 
+# Scorer keys tried in order for a player's display name / team
+_NAME_KEYS = ("name", "shortName", "longName")
+_TEAM_KEYS = ("teamShortName", "teamName")
+
 
 class WaiversService:
 	"""Feature module for waiver/claim operations."""
@@ -9,10 +17,31 @@ class WaiversService:
 	_DISPLAYED_MISC_DISPLAY_TYPE = "1"
 	_DISPLAYED_SCORING_CATEGORY_TYPE = "5"
 	_DEFAULT_VIEW = "STATS"
+	# getPlayerStats pages are reused for this long (seconds); see clear_cache()
+	_PAGE_TTL = 60.0
 
 	def __init__(self, request_callable, api):
 		self._request = request_callable
 		self._api = api
+		# (status, pos_or_group, page_number, max_results) -> (monotonic time, data)
+		self._page_cache: Dict[tuple, tuple] = {}
+		# Same key -> Future of a fetch in progress on another thread
+		self._inflight: Dict[tuple, Future] = {}
+		self._inflight_lock = threading.Lock()
+
+	def clear_cache(self) -> None:
+		"""Forget cached getPlayerStats pages (e.g. after a roster-changing call)."""
+		self._page_cache.clear()
+
+	def _cached_page(self, key: tuple) -> Optional[Dict[str, Any]]:
+		hit = self._page_cache.get(key)
+		if hit and time.monotonic() - hit[0] < self._PAGE_TTL:
+			return hit[1]
+		return None
+
+	def _store_page(self, key: tuple, data: Any) -> None:
+		if isinstance(data, dict):
+			self._page_cache[key] = (time.monotonic(), data)
 
 	# ---------- UI-identical list call ----------
 	def _fetch_player_stats_page(
@@ -31,7 +60,84 @@ class WaiversService:
 			- pageNumber
 			- (optional) posOrGroup + displayedPosOrGroup
 			- displayedView, displayedMiscDisplayType, displayedScoringCategoryType
+		The page comes back parsed by _parse_page and is cached for _PAGE_TTL
+		seconds; concurrent identical calls share one request. Treat the
+		result as read-only.
 		"""
+		return self._fetch_player_stats_pages(
+			range(page_number, page_number + 1), status=status, pos_or_group=pos_or_group, max_results=max_results,
+		)[0]
+
+	def _fetch_player_stats_pages(
+		self,
+		pages: range,
+		*,
+		status: str = "ALL_AVAILABLE",
+		pos_or_group: Optional[str] = None,
+		max_results: Optional[int] = None
+	) -> List[Dict[str, Any]]:
+		"""Several getPlayerStats pages; uncached ones share one FXPA round-trip (one msg per page)."""
+		keys = [(status, pos_or_group, n, max_results) for n in pages]
+		found = {key: data for key in keys if (data := self._cached_page(key)) is not None}
+		missing = [key for key in keys if key not in found]
+		if missing:
+			found.update(self._single_flight(missing))
+		return [found[key] for key in keys]
+
+	def _single_flight(self, keys: List[tuple]) -> Dict[tuple, Dict[str, Any]]:
+		"""
+		Fetch, parse and cache the pages for `keys`. A page another thread is
+		already fetching is not requested again; this call waits for that
+		thread's result (or exception) instead.
+		"""
+		waiting: Dict[tuple, Future] = {}
+		owned: List[tuple] = []
+		with self._inflight_lock:
+			for key in keys:
+				fut = self._inflight.get(key)
+				if fut is None:
+					fut = self._inflight[key] = Future()
+					owned.append(key)
+				waiting[key] = fut
+
+		if owned:
+			try:
+				for key, data in zip(owned, map(self._parse_page, self._request_pages(owned))):
+					self._store_page(key, data)
+					waiting[key].set_result(data)
+				for key in owned:
+					if not waiting[key].done():
+						waiting[key].set_exception(FantraxException("getPlayerStats: missing response"))
+			except BaseException as e:
+				for key in owned:
+					if not waiting[key].done():
+						waiting[key].set_exception(e)
+				raise
+			finally:
+				with self._inflight_lock:
+					for key in owned:
+						self._inflight.pop(key, None)
+
+		return {key: fut.result() for key, fut in waiting.items()}
+
+	def _request_pages(self, keys: List[tuple]) -> List[Any]:
+		"""Raw getPlayerStats responses for `keys`; one msg per page in a single request."""
+		params = [
+			self._player_stats_params(page_number=page, status=status, pos_or_group=pos_or_group, max_results=max_results)
+			for status, pos_or_group, page, max_results in keys
+		]
+		if len(params) == 1:
+			return [self._request("getPlayerStats", **params[0])]
+		return self._api._request_batch([("getPlayerStats", data) for data in params])
+
+	def _player_stats_params(
+		self,
+		*,
+		page_number: int,
+		status: str,
+		pos_or_group: Optional[str],
+		max_results: Optional[int]
+	) -> Dict[str, Any]:
 		data: Dict[str, Any] = {
 			"statusOrTeamFilter": status,
 			"pageNumber": str(page_number),
@@ -45,10 +151,54 @@ class WaiversService:
 			data["displayedPosOrGroup"] = pos_or_group
 		if max_results:
 			data["maxResultsPerPage"] = str(max_results)
+		return data
 
-		return self._request("getPlayerStats", **data)
+	@classmethod
+	def _parse_page(cls, resp: Any) -> Dict[str, Any]:
+		"""
+		Reduce a getPlayerStats page to what the listing methods use:
+		  players - _player_summary of each valid row, built once per fetch
+		  numRows - row count before filtering (0 means past the last page)
+		  paginatedResultSet - as returned
+		so cached/crawled pages stay small and cache hits skip re-parsing.
+		"""
+		rows = cls._stats_rows(resp)
+		return {
+			"players": [p for p in map(cls._player_summary, rows) if p],
+			"numRows": len(rows),
+			"paginatedResultSet": (resp.get("paginatedResultSet") or {}) if isinstance(resp, dict) else {},
+		}
+
+	@staticmethod
+	def _stats_rows(resp: Any) -> List[Dict[str, Any]]:
+		data_block = resp if isinstance(resp, dict) else {}
+		table = data_block.get("statsTable") or data_block.get("table") or []
+		return table if isinstance(table, list) else table.get("rows", [])
+
+	@staticmethod
+	def _total_pages(resp: Any) -> Optional[int]:
+		prs = (resp.get("paginatedResultSet") or {}) if isinstance(resp, dict) else {}
+		try:
+			return int(prs["totalNumPages"])
+		except (KeyError, TypeError, ValueError):
+			return None
+
+	@staticmethod
+	def _player_summary(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+		"""Flatten a getPlayerStats row; None if it has no scorer id or name."""
+		scorer = row.get("scorer") or row.get("player") or {}
+		pid = scorer.get("scorerId")
+		name = next((scorer[k] for k in _NAME_KEYS if scorer.get(k)), None)
+		if not (pid and name):
+			return None
+		return {
+			"id": pid,
+			"name": name,
+			"team": next((scorer[k] for k in _TEAM_KEYS if scorer.get(k)), None),
+			"position": scorer.get("posShortNames"),
+			"default_pos_id": scorer.get("defaultPosId"),
+		}
 
-	# ---------- Submit (UI-mirroring flow) ----------
 	def submit_claim(
 		self,
 		*,
@@ -66,57 +216,58 @@ class WaiversService:
 		  1. getScorerDetails - Initial player info
 		  2. getClaimDropConfirmInfo - Pre-submit validation
 		  3. createClaimDrop - The actual claim submission
+		All three go out in order as one FXPA request; the createClaimDrop
+		response is returned.
 		"""
-		try:
-			# 1. Get initial player info
-			self._request(
-				"getScorerDetails",
-				scorers=[{"scorerId": claim_scorer_id, "action": "CLAIM"}],
-				teamId=team_id,
-			)
+		tx = {
+			"type": "CLAIM",
+			"scorerId": claim_scorer_id,
+			"teamId": team_id,
+		}
+		if bid_amount:
+			tx["bid"] = str(bid_amount)
 
-			# 2. Pre-submit validation
-			tx = {
-				"type": "CLAIM",
-				"scorerId": claim_scorer_id,
-				"teamId": team_id,
-			}
-			if bid_amount:
-				tx["bid"] = str(bid_amount)
-
-			self._request(
-				"getClaimDropConfirmInfo",
-				transactionSets=[{"transactions": [tx]}],
-			)
+		tx_submit = {
+			"type": "CLAIM",
+			"scorerId": claim_scorer_id,
+			"teamId": team_id,
+			"positionId": to_position_id,
+			"claimToStatusId": to_status_id,
+			"doConfirm": True,
+		}
+		if bid_amount:
+			tx_submit["bid"] = bid_amount
 
-			# 3. Submit the claim
-			tx_submit = {
-				"type": "CLAIM",
-				"scorerId": claim_scorer_id,
-				"teamId": team_id,
-				"positionId": to_position_id,
-				"claimToStatusId": to_status_id,
-				"doConfirm": True,
-			}
-			if bid_amount:
-				tx_submit["bid"] = bid_amount
-
-			if drop_scorer_id:
-				tx_submit["dropScorerId"] = drop_scorer_id
-
-			if priority is not None:
-				tx_submit["priority"] = priority
-			if group is not None:
-				tx_submit["group"] = group
-
-			return self._request(
-				"createClaimDrop",
-				transactionSets=[{"transactions": [tx_submit]}],
-			)
+		if drop_scorer_id:
+			tx_submit["dropScorerId"] = drop_scorer_id
+
+		if priority is not None:
+			tx_submit["priority"] = priority
+		if group is not None:
+			tx_submit["group"] = group
 
+		try:
+			results = self._api._request_batch([
+				# 1. Initial player info
+				("getScorerDetails", {
+					"scorers": [{"scorerId": claim_scorer_id, "action": "CLAIM"}],
+					"teamId": team_id,
+				}),
+				# 2. Pre-submit validation
+				("getClaimDropConfirmInfo", {"transactionSets": [{"transactions": [tx]}]}),
+				# 3. Submit the claim
+				("createClaimDrop", {"transactionSets": [{"transactions": [tx_submit]}]}),
+			])
 		except FantraxException as e:
 			raise FantraxException(f"Failed to submit claim: {e}")
 
+		# Availability changes once a claim is in; don't serve stale player pages
+		self.clear_cache()
+		for method, data in zip(("getScorerDetails", "getClaimDropConfirmInfo", "createClaimDrop"), results):
+			if isinstance(data, dict) and data.get("pageError"):
+				raise FantraxException(f"Failed to submit claim: {method}: {data['pageError']}")
+		return results[-1]
+
 	# ---------- Search / Browse ----------
 	def search_players(
 		self,
@@ -125,9 +276,12 @@ class WaiversService:
 		max_results: int = 25,
 		status: str = "ALL_AVAILABLE",
 	) -> List[Dict[str, Any]]:
-		# 1) Try server-side search via getPlayerStats
+		per_page = max(1, min(50, max_results))
+		q = (query or "").lower()
+
+		# 1) Try server-side search via getPlayerStats; any rows back means the
+		# server understood the query, so the fallback is skipped
 		try:
-			per_page = max(1, min(50, max_results))
 			resp = self._request(
 				"getPlayerStats",
 				statusOrTeamFilter=status,
@@ -140,72 +294,26 @@ class WaiversService:
 				searchName=query,
 				maxResultsPerPage=str(per_page),
 			)
-			players: List[Dict[str, Any]] = []
-			data_block = resp if isinstance(resp, dict) else {}
-			table = data_block.get("statsTable") or data_block.get("table") or []
-			rows = table if isinstance(table, list) else table.get("rows", [])
-			for row in rows:
-				scorer = row.get("scorer") or row.get("player") or {}
-				pid = scorer.get("scorerId")
-				name = scorer.get("name") or scorer.get("shortName") or scorer.get("longName")
-				if not (pid and name):
-					continue
-				players.append({
-					"id": pid,
-					"name": name,
-					"team": scorer.get("teamShortName") or scorer.get("teamName"),
-					"position": scorer.get("posShortNames"),
-					"default_pos_id": scorer.get("defaultPosId"),
-				})
+			players = self._parse_page(resp)["players"]
 			if players:
 				return players[:max_results]
 		except FantraxException:
 			pass
 
-		# 2) Client-side filter via paging
-		results: List[Dict[str, Any]] = []
-		page_number = 1
+		# 2) Client-side filter via paging: the first 10 pages go out as one
+		# batched request, then are filtered up to totalNumPages (Fantrax may
+		# repeat the last page past it) or the first empty page
 		try:
-			while len(results) < max_results and page_number <= 10:
-				per_page = max(1, min(50, max_results - len(results)))
-				resp = self._fetch_player_stats_page(
-					page_number=page_number,
-					status=status,
-					pos_or_group=pos_or_group,
-					max_results=per_page,
-				)
-				data_block = resp if isinstance(resp, dict) else {}
-				table = data_block.get("statsTable") or data_block.get("table") or []
-				rows = table if isinstance(table, list) else table.get("rows", [])
-				if not rows:
-					break
-				q = (query or "").lower()
-				for row in rows:
-					scorer = row.get("scorer") or row.get("player") or {}
-					name = scorer.get("name") or scorer.get("shortName") or scorer.get("longName")
-					if not name or (q and q not in name.lower()):
-						continue
-					pid = scorer.get("scorerId")
-					if not pid:
-						continue
-					results.append({
-						"id": pid,
-						"name": name,
-						"team": scorer.get("teamShortName") or scorer.get("teamName"),
-						"position": scorer.get("posShortNames"),
-						"default_pos_id": scorer.get("defaultPosId"),
-					})
-					if len(results) >= max_results:
-						break
-				prs = data_block.get("paginatedResultSet") or {}
-				total_pages = prs.get("totalNumPages")
-				page_number += 1
-				if total_pages and isinstance(total_pages, (int, str)) and page_number > int(total_pages):
-					break
+			resps = self._fetch_player_stats_pages(
+				range(1, 11), status=status, pos_or_group=pos_or_group, max_results=per_page,
+			)
 		except FantraxException as e:
 			raise FantraxException(f"search_players(getPlayerStats) failed: {e}")
 
-		return results[:max_results]
+		resps = resps[:self._total_pages(resps[0]) or len(resps)]
+		players = (p for page in takewhile(lambda page: page["numRows"], resps) for p in page["players"])
+		matches = (p for p in players if not q or q in p["name"].lower())
+		return list(islice(matches, max_results))
 
 	def list_players_by_name(
 		self,
@@ -213,57 +321,21 @@ class WaiversService:
 		pos_or_group: Optional[str] = None,	  # None => do NOT send posOrGroup (UI behavior for "All")
 		status: str = "ALL_AVAILABLE",
 	) -> List[Dict[str, Any]]:
-		collected: List[Dict[str, Any]] = []
-		page_number = 1
-		last_total_pages: Optional[int] = None
+		per_page = max(1, min(50, limit))
+		kwargs = dict(status=status, pos_or_group=pos_or_group, max_results=per_page)
 
 		try:
-			while True:
-				per_page = max(1, min(50, limit - len(collected)))
-				resp = self._fetch_player_stats_page(
-					page_number=page_number,
-					status=status,
-					pos_or_group=pos_or_group,
-					max_results=per_page,
-				)
-
-				if not isinstance(resp, dict):
-					break
-
-				data_block = resp
-				table = data_block.get("statsTable") or data_block.get("table") or []
-				rows = table if isinstance(table, list) else table.get("rows", [])
-				if not rows:
-					break
-
-				for row in rows:
-					scorer = row.get("scorer") or row.get("player") or {}
-					pid = scorer.get("scorerId")
-					name = scorer.get("name") or scorer.get("shortName") or scorer.get("longName")
-					if not (pid and name):
-						continue
-					collected.append({
-						"id": pid,
-						"name": name,
-						"team": scorer.get("teamShortName") or scorer.get("teamName"),
-						"position": scorer.get("posShortNames"),
-						"default_pos_id": scorer.get("defaultPosId"),
-					})
-					if len(collected) >= limit:
-						return collected[:limit]
-
-				prs = data_block.get("paginatedResultSet") or {}
-				if last_total_pages is None and "totalNumPages" in prs:
-					try:
-						last_total_pages = int(prs["totalNumPages"])
-					except Exception:
-						last_total_pages = None
-
-				page_number += 1
-				if last_total_pages and page_number > last_total_pages:
-					break
-
+			# Page 1 alone learns totalNumPages; every other page `limit` needs
+			# is known from then on and goes out in one batched request.
+			pages = self._fetch_player_stats_pages(range(1, 2), **kwargs)
+			last = -(-limit // per_page)	# ceil
+			total_pages = self._total_pages(pages[0])
+			if total_pages:
+				last = min(last, total_pages)
+			if last > 1 and pages[0]["numRows"]:
+				pages += self._fetch_player_stats_pages(range(2, last + 1), **kwargs)
 		except FantraxException as e:
 			raise FantraxException(f"list_players_by_name(getPlayerStats) failed: {e}")
 
+		collected = [p for page in takewhile(lambda page: page["numRows"], pages) for p in page["players"]]
 		return collected[:limit]
\ No newline at end of file
@@ -6,16 +6,23 @@ Checks Fantrax starting players page and adjusts lineups accordingly.
 
 import os
 import time
+import asyncio
+import signal
 import json
-import pickle
+import sys
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from configparser import ConfigParser
 from typing import Dict, List, Set, Optional, Tuple
+from collections import Counter, defaultdict
+from operator import itemgetter
 from dataclasses import dataclass
 from requests import Session
 from fantraxapi import FantraxAPI
+from utils.cookie_import import load_cookie_dict
 
 # Configure logging
 logging.basicConfig(
@@ -27,36 +34,96 @@ logging.basicConfig(
 	]
 )
 
-@dataclass
-class Formation:
+# Roster position short name -> change to (gk, def_, mid, fwd) counts
+POS_DELTA = {"G": (1, 0, 0, 0), "D": (0, 1, 0, 0), "M": (0, 0, 1, 0), "F": (0, 0, 0, 1)}
+NO_DELTA = (0, 0, 0, 0)
+
+# Every legal (gk, def_, mid, fwd): exactly 11 players, 1 GK, 3-5 DEF,
+# 2-5 MID, 1-3 FWD
+LEGAL_FORMATIONS = frozenset(
+	(1, d, m, f)
+	for d in range(3, 6)
+	for m in range(2, 6)
+	for f in range(1, 4)
+	if 1 + d + m + f == 11
+)
+
+# Game time as shown on the starting-players page, e.g. "4:00PM"
+_GAME_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*([AP])M", re.IGNORECASE)
+
+def parse_game_time(time_str: str, now: datetime) -> datetime:
+	"""Today's (UTC) datetime for a "h:mmAM/PM" string; ValueError if malformed.
+
+	Equivalent to strptime(..., "%I:%M%p") without re-parsing the format
+	string for every player.
+	"""
+	m = _GAME_TIME_RE.fullmatch(time_str.strip())
+	if not m:
+		raise ValueError(f"unrecognised game time {time_str!r}")
+	hour = int(m.group(1))
+	if not 1 <= hour <= 12:
+		raise ValueError(f"hour out of range in {time_str!r}")
+	hour = hour % 12 + (12 if m.group(3).upper() == "P" else 0)
+	return datetime(now.year, now.month, now.day, hour, int(m.group(2)), tzinfo=timezone.utc)
+
+class _FrozenSlotsState:
+	"""Copy/pickle support for frozen dataclasses with hand-written __slots__.
+
+	The default slot-state restore assigns with setattr, which a frozen
+	dataclass rejects; restore through object.__setattr__ instead.
+	"""
+	__slots__ = ()
+
+	def __getstate__(self) -> tuple:
+		return tuple(getattr(self, name) for name in self.__slots__)
+
+	def __setstate__(self, state: tuple) -> None:
+		for name, value in zip(self.__slots__, state):
+			object.__setattr__(self, name, value)
+
+@dataclass(frozen=True)
+class Formation(_FrozenSlotsState):
+	# Explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10
+	__slots__ = ("gk", "def_", "mid", "fwd")
 	gk: int
 	def_: int
 	mid: int
 	fwd: int
 
-	def is_legal(self) -> bool:
-		"""Check if formation meets requirements:
+	@staticmethod
+	def counts_legal(gk: int, def_: int, mid: int, fwd: int) -> bool:
+		"""Check if formation counts are one of LEGAL_FORMATIONS:
 		- Exactly 11 players total
 		- 1 GK
 		- Between 3-5 DEF
 		- Between 2-5 MID
 		- Between 1-3 FWD
 		"""
-		total_players = self.gk + self.def_ + self.mid + self.fwd
+		return (gk, def_, mid, fwd) in LEGAL_FORMATIONS
+
+	def is_legal(self) -> bool:
+		"""Check if this formation meets the requirements of counts_legal()."""
+		return self.counts_legal(self.gk, self.def_, self.mid, self.fwd)
+
+	def after_swap(self, out_pos: str, in_pos: str) -> Tuple[int, int, int, int]:
+		"""Counts after moving an `out_pos` starter to the bench and an `in_pos` player in."""
+		d_out = POS_DELTA.get(out_pos, NO_DELTA)
+		d_in = POS_DELTA.get(in_pos, NO_DELTA)
 		return (
-			total_players == 11 and	 # Must have exactly 11 players
-			self.gk == 1 and
-			3 <= self.def_ <= 5 and
-			2 <= self.mid <= 5 and
-			1 <= self.fwd <= 3
+			self.gk - d_out[0] + d_in[0],
+			self.def_ - d_out[1] + d_in[1],
+			self.mid - d_out[2] + d_in[2],
+			self.fwd - d_out[3] + d_in[3],
 		)
 
 	def __str__(self) -> str:
 		return f"{self.gk}-{self.def_}-{self.mid}-{self.fwd}"
 
-@dataclass
-class PlayerStatus:
+@dataclass(frozen=True)
+class PlayerStatus(_FrozenSlotsState):
 	"""Represents a player's current status for lineup decisions"""
+	# Explicit __slots__ as on Formation (dataclass(slots=True) needs Python 3.10)
+	__slots__ = ("is_starting", "is_benched", "game_time", "is_locked", "opponent")
 	is_starting: Optional[bool]	 # None means we don't know yet (game too far away)
 	is_benched: Optional[bool]	 # None means we don't know yet
 	game_time: Optional[datetime]
@@ -89,14 +156,21 @@ class LineupOptimizer:
 		self.api = FantraxAPI(league_id, session=self.session)
 		self.player_statuses: Dict[str, PlayerStatus] = {}	# player_id -> PlayerStatus
 		self.last_check_time = None
+		# Fingerprint of player_statuses from the last fetch, and when the last
+		# full optimization pass finished (monotonic); see optimize_lineup()
+		self._last_statuses_hash: Optional[int] = None
+		# False until a fetch succeeds, and again after any failed fetch: the
+		# statuses are then unknown and no swaps are planned from them
+		self._statuses_valid = False
+		self._last_full_pass: Optional[float] = None
+		# page number -> {"etag", "last_modified", "data"} for conditional GETs
+		self._page_cache: Dict[int, dict] = {}
 
 	def _init_session(self) -> Session:
 		"""Initialize session with cookies"""
 		session = Session()
 		try:
-			with open(self.cookie_path, "rb") as f:
-				for cookie in pickle.load(f):
-					session.cookies.set(cookie["name"], cookie["value"])
+			session.cookies.update(load_cookie_dict(self.cookie_path))
 			logging.info("Cookie session loaded successfully")
 			return session
 		except Exception as e:
@@ -104,7 +178,18 @@ class LineupOptimizer:
 			raise
 
 	def fetch_player_page(self, page: int = 1) -> dict:
-		"""Fetch a single page of player data"""
+		"""Fetch a single page of player data
+
+		Conditional GET: the page's ETag / Last-Modified from the previous poll
+		are sent back, and on 304 Not Modified the previous body is reused.
+		"""
+		headers = {}
+		cached = self._page_cache.get(page)
+		if cached:
+			if cached["etag"]:
+				headers["If-None-Match"] = cached["etag"]
+			if cached["last_modified"]:
+				headers["If-Modified-Since"] = cached["last_modified"]
 		response = self.session.get(
 			"https://www.fantrax.com/fxpa/req",
 			params={
@@ -113,9 +198,20 @@ class LineupOptimizer:
 				"miscDisplayType": "10",  # Starting players
 				"pageNumber": str(page),
 				"maxResultsPerPage": "100"	# Get more results per page
-			}
+			},
+			headers=headers,
+			timeout=10,
 		)
-		return response.json()
+		if response.status_code == 304 and cached:
+			return cached["data"]
+		data = response.json()
+		etag = response.headers.get("ETag")
+		last_modified = response.headers.get("Last-Modified")
+		if etag or last_modified:
+			self._page_cache[page] = {"etag": etag, "last_modified": last_modified, "data": data}
+		else:
+			self._page_cache.pop(page, None)
+		return data
 
 	def update_player_statuses(self) -> None:
 		"""Fetch and parse the starting players page to update player statuses"""
@@ -124,9 +220,6 @@ class LineupOptimizer:
 			now = datetime.now(timezone.utc)
 			self.last_check_time = now
 			
-			# Clear existing statuses
-			self.player_statuses.clear()
-			
 			# Fetch first page
 			data = self.fetch_player_page(1)
 			
@@ -139,27 +232,29 @@ class LineupOptimizer:
 			logging.info(f"Found {total_results} total players across {total_pages} pages "
 						f"(Results per page: {results_per_page})")
 			
-			# Process all pages
+			# Process all pages; pages 2..N are fetched concurrently over the
+			# session's pooled keep-alive connections
+			pages = [data]
+			if total_pages > 1:
+				with ThreadPoolExecutor(max_workers=min(8, total_pages - 1)) as pool:
+					pages.extend(pool.map(self.fetch_player_page, range(2, total_pages + 1)))
+
 			all_players = []
-			current_page = 1
-			
-			while current_page <= total_pages:
-				if current_page > 1:
-					data = self.fetch_player_page(current_page)
-				
+			for current_page, data in enumerate(pages, start=1):
 				if "statsTable" in data["responses"][0]["data"]:
 					stats_table = data["responses"][0]["data"]["statsTable"]
 					all_players.extend(stats_table)
 					logging.info(f"Fetched page {current_page}/{total_pages} "
 							   f"({len(stats_table)} players)")
-				
-				current_page += 1
 			
 			logging.info(f"Processing {len(all_players)} total players")
 			
-			# Process all players
+			# Process all players, updating player_statuses in place: unchanged
+			# entries are kept, players no longer listed are dropped afterwards
+			seen: Set[str] = set()
 			for player in all_players:
-					player_id = player["scorerId"]
+					player_id = sys.intern(player["scorerId"])
+					seen.add(player_id)
 					
 					# Parse game time if available
 					game_time = None
@@ -171,9 +266,7 @@ class LineupOptimizer:
 							opponent = opp_info[0]
 							try:
 								# Convert game time string to datetime
-								time_str = opp_info[1]
-								game_time = datetime.strptime(f"{now.date()} {time_str}", "%Y-%m-%d %I:%M%p")
-								game_time = game_time.replace(tzinfo=timezone.utc)
+								game_time = parse_game_time(opp_info[1], now)
 							except ValueError:
 								logging.warning(f"Could not parse game time: {opp_info[1]}")
 					
@@ -200,6 +293,11 @@ class LineupOptimizer:
 						is_starting = False
 						is_benched = True
 					
+					existing = self.player_statuses.get(player_id)
+					if existing is not None and (
+						existing.is_starting, existing.is_benched, existing.game_time, existing.is_locked, existing.opponent
+					) == (is_starting, is_benched, game_time, is_locked, opponent):
+						continue
 					self.player_statuses[player_id] = PlayerStatus(
 						is_starting=is_starting,
 						is_benched=is_benched,
@@ -207,49 +305,83 @@ class LineupOptimizer:
 						is_locked=is_locked,
 						opponent=opponent
 					)
+
+			for player_id in self.player_statuses.keys() - seen:
+				del self.player_statuses[player_id]
 			
 			starting_count = sum(1 for status in self.player_statuses.values() if status.is_starting)
 			logging.info(f"Found {starting_count} starting players")
+			self._last_statuses_hash = hash(frozenset(
+				(pid, status.is_starting, status.is_benched, status.is_locked)
+				for pid, status in self.player_statuses.items()
+			))
+			self._statuses_valid = True
 			
 		except Exception as e:
 			logging.error(f"Error updating player statuses: {e}")
+			# Stale lock/starting flags must not drive swaps
+			self.player_statuses.clear()
+			self._statuses_valid = False
+			self._last_statuses_hash = None
 			
+	# Shortest sleep next_check_delay() returns, so a burst of kickoffs
+	# cannot turn the loop into a busy poll (seconds)
+	MIN_CHECK_DELAY = 30.0
+
+	def next_check_delay(self, max_delay: float) -> float:
+		"""Seconds until the next player lock boundary (1 minute before kickoff), capped at max_delay
+
+		Lets the polling loop wake right as a lineup is about to lock instead
+		of up to max_delay later; falls back to max_delay with no upcoming
+		lock or after a failed status fetch, and never goes below
+		MIN_CHECK_DELAY.
+		"""
+		if not self._statuses_valid:
+			return max_delay
+		now = datetime.now(timezone.utc)
+		next_lock = min(
+			(
+				status.game_time - timedelta(minutes=1)
+				for status in self.player_statuses.values()
+				if status.game_time and status.game_time - timedelta(minutes=1) > now
+			),
+			default=None,
+		)
+		if next_lock is None:
+			return max_delay
+		return max(min(self.MIN_CHECK_DELAY, max_delay), min(max_delay, (next_lock - now).total_seconds()))
+
 	def get_player_status(self, player_id: str) -> Optional[PlayerStatus]:
 		"""Get status for a specific player"""
 		return self.player_statuses.get(player_id)
 
 	def get_current_formation(self, roster) -> Formation:
 		"""Calculate current formation from roster"""
-		gk = def_ = mid = fwd = 0
-		for row in roster.get_starters():
-			pos = row.pos.short_name
-			if pos == "G":
-				gk += 1
-			elif pos == "D":
-				def_ += 1
-			elif pos == "M":
-				mid += 1
-			elif pos == "F":
-				fwd += 1
-		return Formation(gk, def_, mid, fwd)
+		counts = Counter(row.pos.short_name for row in roster.get_starters())
+		return Formation(counts["G"], counts["D"], counts["M"], counts["F"])
 
 	def get_position_counts(self, roster_rows) -> Dict[str, int]:
 		"""Get counts of each position from a list of roster rows"""
-		counts = {"G": 0, "D": 0, "M": 0, "F": 0}
-		for row in roster_rows:
-			if row.player:	# Only count rows with actual players
-				pos = row.pos.short_name
-				if pos in counts:
-					counts[pos] += 1
-		return counts
-
-	def can_swap_players(self, starter, bench, current_formation: Formation) -> Tuple[bool, str]:
+		# Only count rows with actual players
+		counts = Counter(row.pos.short_name for row in roster_rows if row.player)
+		return {pos: counts[pos] for pos in POS_DELTA}
+
+	def can_swap_players(
+		self,
+		starter,
+		bench,
+		current_formation: Formation,
+		starter_status: Optional[PlayerStatus] = None,
+		bench_status: Optional[PlayerStatus] = None,
+	) -> Tuple[bool, str]:
 		"""Check if two players can be swapped based on formation and game status
 		
 		Args:
 			starter: Player to move to bench
 			bench: Player to move to starting lineup
 			current_formation: Current formation before swap
+			starter_status, bench_status: Statuses the caller already has
+				(looked up when omitted)
 		
 		Returns:
 			Tuple[bool, str]: (can_swap, reason)
@@ -257,56 +389,55 @@ class LineupOptimizer:
 			- reason: Explanation if swap is not allowed
 		"""
 		# Check if starter is locked
-		starter_status = self.get_player_status(starter.player.id)
+		if starter_status is None:
+			starter_status = self.get_player_status(starter.player.id)
 		if starter_status and starter_status.is_locked:
 			return False, f"Cannot move {starter.player.name} to bench - player is locked (game in progress)"
 
 		# Check if bench player is locked
-		bench_status = self.get_player_status(bench.player.id)
+		if bench_status is None:
+			bench_status = self.get_player_status(bench.player.id)
 		if bench_status and bench_status.is_locked:
 			return False, f"Cannot move {bench.player.name} to starting lineup - player is locked (game in progress)"
 			
-		# Create new formation after swap
-		new_formation = Formation(
-			current_formation.gk,
-			current_formation.def_,
-			current_formation.mid,
-			current_formation.fwd
-		)
-		
-		# Adjust counts based on positions
-		if starter.pos.short_name == "G":
-			new_formation.gk -= 1
-		elif starter.pos.short_name == "D":
-			new_formation.def_ -= 1
-		elif starter.pos.short_name == "M":
-			new_formation.mid -= 1
-		elif starter.pos.short_name == "F":
-			new_formation.fwd -= 1
-			
-		if bench.pos.short_name == "G":
-			new_formation.gk += 1
-		elif bench.pos.short_name == "D":
-			new_formation.def_ += 1
-		elif bench.pos.short_name == "M":
-			new_formation.mid += 1
-		elif bench.pos.short_name == "F":
-			new_formation.fwd += 1
+		# Like-for-like swaps leave the formation unchanged
+		out_pos = starter.pos.short_name
+		in_pos = bench.pos.short_name
+		if out_pos == in_pos and current_formation.is_legal():
+			return True, "Same-position swap"
+
+		# New formation after swap as plain ints; a Formation is only built
+		# for the error message
+		counts = current_formation.after_swap(out_pos, in_pos)
 
 		# Check if new formation is legal
-		if not new_formation.is_legal():
+		if not Formation.counts_legal(*counts):
+			new_formation = Formation(*counts)
 			return False, f"Invalid formation after swap: {new_formation} (must have exactly 11 players with valid position counts)"
 			
 		return True, "Swap is valid"
 
-	def find_optimal_swaps(self, roster) -> List[Tuple[any, any, str]]:
+	def allowed_swap_positions(self, formation: Formation) -> Dict[str, Set[str]]:
+		"""For each starter position, the bench positions that keep `formation` legal when swapped in.
+
+		Computed once per optimization pass so candidate pairs that could only
+		fail the formation check are never tried.
+		"""
+		return {
+			out_pos: {in_pos for in_pos in POS_DELTA if Formation.counts_legal(*formation.after_swap(out_pos, in_pos))}
+			for out_pos in POS_DELTA
+		}
+
+	def find_optimal_swaps(self, roster) -> List[Tuple[any, any, str, Optional[PlayerStatus], Optional[PlayerStatus]]]:
 		"""Find optimal swaps based on game times and starting status
 		
 		Returns:
-			List of (starter, bench, reason) tuples representing optimal swaps
+			List of (starter, bench, reason, starter_status, bench_status)
+			tuples representing optimal swaps
 		"""
 		swaps = []
 		current_formation = self.get_current_formation(roster)
+		allowed = self.allowed_swap_positions(current_formation)
 		current_time = datetime.now(timezone.utc)
 		
 		# Collect all players and their statuses
@@ -326,6 +457,26 @@ class LineupOptimizer:
 				continue
 			status = self.get_player_status(bench.player.id)
 			bench_players.append((bench, status))
+
+		# Bench players already paired with a starter (by interned player id)
+		used_bench: Set[str] = set()
+
+		# Bench indexed by position once; each starter then only scans the
+		# positions that keep the formation legal (in original bench order)
+		bench_by_pos: Dict[str, list] = defaultdict(list)
+		confirmed_by_pos: Dict[str, list] = defaultdict(list)
+		for index, (bench, status) in enumerate(bench_players):
+			bench_by_pos[bench.pos.short_name].append((index, bench, status))
+			if status and status.is_starting:
+				confirmed_by_pos[bench.pos.short_name].append((index, bench, status))
+
+		def candidates(starter, by_pos):
+			ok_pos = allowed.get(starter.pos.short_name, ())
+			return [
+				(bench, status)
+				for _, bench, status in sorted((e for pos in ok_pos for e in by_pos.get(pos, ())), key=itemgetter(0))
+				if bench.player.id not in used_bench
+			]
 		
 		# Priority 1: Replace confirmed non-starters in upcoming games with players from later games
 		for starter, starter_status in starter_players:
@@ -334,65 +485,99 @@ class LineupOptimizer:
 				# If we know they're not starting
 				if starter_status.is_confirmed_not_starting():
 					best_bench = None
+					best_bench_status = None
 					best_reason = None
 					latest_game_time = None
 					
-					for bench, bench_status in bench_players:
+					for bench, bench_status in candidates(starter, bench_by_pos):
 						# Look for players with later game times where lineups aren't out yet
 						if bench_status and bench_status.game_time:
 							# Skip if bench player's game is also soon
 							if bench_status.is_game_soon(current_time):
 								continue
 								
-							can_swap, reason = self.can_swap_players(starter, bench, current_formation)
+							can_swap, reason = self.can_swap_players(
+								starter, bench, current_formation, starter_status, bench_status,
+							)
 							if can_swap:
 								# Prefer players from the latest possible game
 								if (not latest_game_time or 
 									(bench_status.game_time > latest_game_time)):
 									
 									if starter.pos.short_name == bench.pos.short_name:
-										best_bench = bench
+										best_bench, best_bench_status = bench, bench_status
 										best_reason = f"Direct position match - replacing confirmed non-starter ({starter_status.opponent}) with player from later game ({bench_status.opponent})"
 										latest_game_time = bench_status.game_time
 									elif not best_bench:
-										best_bench = bench
+										best_bench, best_bench_status = bench, bench_status
 										best_reason = f"Position flexible swap - replacing confirmed non-starter ({starter_status.opponent}) with player from later game ({bench_status.opponent})"
 										latest_game_time = bench_status.game_time
 					
 					if best_bench:
-						swaps.append((starter, best_bench, best_reason))
-						bench_players.remove((best_bench, self.get_player_status(best_bench.player.id)))
+						swaps.append((starter, best_bench, best_reason, starter_status, best_bench_status))
+						used_bench.add(best_bench.player.id)
 		
-		# Priority 2: Replace non-starters with confirmed starters
-		for starter, starter_status in starter_players:
-			if starter_status and starter_status.is_confirmed_not_starting():
-				# Find best bench replacement that's confirmed starting
-				best_bench = None
-				best_reason = None
-				
-				for bench, bench_status in bench_players:
-					if bench_status and bench_status.is_starting:
-						can_swap, reason = self.can_swap_players(starter, bench, current_formation)
-						if can_swap:
-							if starter.pos.short_name == bench.pos.short_name:
-								best_bench = bench
-								best_reason = f"Direct position match - replacing non-starter with confirmed starter"
-								break
-							elif not best_bench:
-								best_bench = bench
-								best_reason = f"Position flexible swap - replacing non-starter with confirmed starter"
-				
-				if best_bench:
-					swaps.append((starter, best_bench, best_reason))
-					bench_players.remove((best_bench, self.get_player_status(best_bench.player.id)))
+		# Priority 2: Replace non-starters with confirmed starters. Both sides
+		# are filtered once up front instead of per (starter, bench) pair.
+		needs_swap = [(s, st) for s, st in starter_players if st and st.is_confirmed_not_starting()]
+		for starter, starter_status in needs_swap:
+			# Find best bench replacement that's confirmed starting
+			best_bench = None
+			best_bench_status = None
+			best_reason = None
+			
+			for bench, bench_status in candidates(starter, confirmed_by_pos):
+				can_swap, reason = self.can_swap_players(
+					starter, bench, current_formation, starter_status, bench_status,
+				)
+				if can_swap:
+					if starter.pos.short_name == bench.pos.short_name:
+						best_bench, best_bench_status = bench, bench_status
+						best_reason = f"Direct position match - replacing non-starter with confirmed starter"
+						break
+					elif not best_bench:
+						best_bench, best_bench_status = bench, bench_status
+						best_reason = f"Position flexible swap - replacing non-starter with confirmed starter"
+			
+			if best_bench:
+				swaps.append((starter, best_bench, best_reason, starter_status, best_bench_status))
+				used_bench.add(best_bench.player.id)
 				
 		return swaps
 
+	# A tick whose player statuses match the previous one is skipped, but a
+	# full pass still runs at least this often (seconds)
+	FULL_PASS_INTERVAL = 15 * 60
+
 	def optimize_lineup(self):
 		"""Main optimization logic"""
 		try:
-			# Get current roster
-			roster = self.api.roster_info(self.team_id)
+			previous_hash = self._last_statuses_hash
+			may_skip = (
+				self._last_full_pass is not None
+				and time.monotonic() - self._last_full_pass < self.FULL_PASS_INTERVAL
+			)
+			if may_skip:
+				# Update player statuses; if nothing changed since the last
+				# full pass there is nothing new to act on
+				self.update_player_statuses()
+				if self._last_statuses_hash is not None and self._last_statuses_hash == previous_hash:
+					logging.info("Player statuses unchanged since last check; skipping")
+					return
+				roster = self.api.roster_info(self.team_id)
+			else:
+				# A full pass is due anyway: fetch the roster and player
+				# statuses concurrently (both share the pooled session)
+				with ThreadPoolExecutor(max_workers=2) as pool:
+					roster_future = pool.submit(self.api.roster_info, self.team_id)
+					statuses_future = pool.submit(self.update_player_statuses)
+					roster = roster_future.result()
+					statuses_future.result()
+
+			if not self._statuses_valid:
+				logging.warning("Player statuses unavailable; skipping this check")
+				return
+
 			current_formation = self.get_current_formation(roster)
 			logging.info(f"Current formation: {current_formation}")
 
@@ -400,23 +585,18 @@ class LineupOptimizer:
 			if not current_formation.is_legal():
 				logging.error(f"Current formation {current_formation} is invalid! Must have exactly 11 players with valid position counts.")
 				return
-
-			# Update player statuses
-			self.update_player_statuses()
 			
 			# Find optimal swaps
 			optimal_swaps = self.find_optimal_swaps(roster)
 			
 			if not optimal_swaps:
 				logging.info("No valid swaps found")
+				self._last_full_pass = time.monotonic()
 				return
 				
 			# Log planned swaps
 			logging.info("\nPlanned substitutions:")
-			for starter, bench, reason in optimal_swaps:
-				starter_status = self.get_player_status(starter.player.id)
-				bench_status = self.get_player_status(bench.player.id)
-				
+			for starter, bench, reason, starter_status, bench_status in optimal_swaps:
 				# Get status strings
 				def get_status_str(status):
 					if not status:
@@ -440,16 +620,22 @@ class LineupOptimizer:
 				logging.info(f"	 Reason: {reason}\n")
 
 			# Execute swaps
-			for starter, bench, _ in optimal_swaps:
+			all_ok = True
+			for starter, bench, *_ in optimal_swaps:
 				try:
 					success = self.api.swap_players(self.team_id, starter.player.id, bench.player.id)
 					if success:
 						logging.info(f"✅ Successfully swapped {starter.player.name} with {bench.player.name}")
 					else:
+						all_ok = False
 						logging.error(f"❌ Failed to swap {starter.player.name} with {bench.player.name}")
 				except Exception as e:
+					all_ok = False
 					logging.error(f"Error making swap: {e}")
 
+			# Only a clean pass lets the next unchanged tick be skipped
+			self._last_full_pass = time.monotonic() if all_ok else None
+
 		except Exception as e:
 			logging.error(f"Error in optimize_lineup: {e}")
 
@@ -471,6 +657,39 @@ def load_config():
 		"cookie_path": config["fantrax"]["cookie_path"]
 	}
 
+async def run_optimizer(optimizer: LineupOptimizer, check_interval: int) -> None:
+	"""Run optimize_lineup every `check_interval` seconds (sooner if a player
+	lock falls in between) until SIGINT or SIGTERM.
+
+	Each pass runs in the default executor (the HTTP client is blocking), so
+	the event loop stays free to react to a signal while a pass or sleep is
+	in progress: a sleep ends at once, a running pass finishes first.
+	"""
+	loop = asyncio.get_running_loop()
+	stop = asyncio.Event()
+	for sig in (signal.SIGINT, signal.SIGTERM):
+		try:
+			loop.add_signal_handler(sig, stop.set)
+		except (NotImplementedError, RuntimeError):
+			pass	# e.g. Windows; KeyboardInterrupt in main() still applies
+
+	while not stop.is_set():
+		try:
+			logging.info("Running lineup optimization...")
+			await loop.run_in_executor(None, optimizer.optimize_lineup)
+			delay = optimizer.next_check_delay(check_interval)
+		except Exception as e:
+			logging.error(f"Error in main loop: {e}")
+			delay = 60	# Wait a minute before retrying
+
+		logging.info(f"Sleeping for {delay:.0f} seconds...")
+		try:
+			await asyncio.wait_for(stop.wait(), timeout=delay)
+		except asyncio.TimeoutError:
+			pass
+
+	logging.info("Optimization stopped by user")
+
 def main():
 	# Load configuration
 	config = load_config()
@@ -484,20 +703,10 @@ def main():
 	
 	# Run continuous optimization loop
 	check_interval = 300  # 5 minutes
-	while True:
-		try:
-			logging.info("Running lineup optimization...")
-			optimizer.optimize_lineup()
-			
-			logging.info(f"Sleeping for {check_interval} seconds...")
-			time.sleep(check_interval)
-			
-		except KeyboardInterrupt:
-			logging.info("Optimization stopped by user")
-			break
-		except Exception as e:
-			logging.error(f"Error in main loop: {e}")
-			time.sleep(60)	# Wait a minute before retrying
+	try:
+		asyncio.run(run_optimizer(optimizer, check_interval))
+	except KeyboardInterrupt:
+		logging.info("Optimization stopped by user")
 
 if __name__ == "__main__":
 	main()
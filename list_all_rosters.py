@@ -4,6 +4,7 @@ Script to display all rosters from multiple Fantrax leagues side by side.
 """
 
 import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List
 from fantraxapi import FantraxAPI
 from fantraxapi.objs import Roster, RosterRow
@@ -88,21 +89,28 @@ def main():
 	# Load configuration
 	config = load_league_config()
 	
-	# Create session for reuse
+	# Create session for reuse; pooled up front so the worker threads below
+	# share keep-alive connections instead of racing to mount an adapter
 	session = Session()
+	FantraxAPI._tune_session(session)
 	
-	# Get rosters for all leagues
-	rosters = {}
-	for league_name, league_info in config['leagues'].items():
-		try:
-			roster = get_roster_for_league(
-				league_info['league_id'],
-				league_info['team_id'],
-				session
-			)
-			rosters[league_name] = roster
-		except Exception as e:
-			print(f"Error fetching roster for {league_name}: {e}")
+	# Get rosters for all leagues concurrently (one blocking request each)
+	leagues = config['leagues']
+	fetched = {}
+	with ThreadPoolExecutor(max_workers=max(1, min(16, len(leagues)))) as executor:
+		futures = {
+			executor.submit(get_roster_for_league, league_info['league_id'], league_info['team_id'], session): league_name
+			for league_name, league_info in leagues.items()
+		}
+		for future in as_completed(futures):
+			league_name = futures[future]
+			try:
+				fetched[league_name] = future.result()
+			except Exception as e:
+				print(f"Error fetching roster for {league_name}: {e}")
+
+	# Keep the config's league order for display
+	rosters = {name: fetched[name] for name in leagues if name in fetched}
 	
 	# Display rosters
 	display_rosters(rosters)
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
-import pickle
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
 import shutil
+import time
 
 from fantraxapi import FantraxAPI
+from utils.cookie_import import load_cookie_dict
 from requests import Session
 
 
@@ -22,18 +23,18 @@ def load_config(config_path: str = "config.ini") -> dict:
 
 def load_session(cookie_path: str) -> Session:
 	session = Session()
-	with open(cookie_path, "rb") as f:
-		for cookie in pickle.load(f):
-			session.cookies.set(cookie["name"], cookie["value"])
+	session.cookies.update(load_cookie_dict(cookie_path))
 	return session
 
 
-def _segment_columns(headers: List[str], columns: List[List[str]], max_width: int) -> List[Tuple[List[str], List[List[str]]]]:
-	# Compute desired widths per column
-	desired_widths = []
-	for header, col in zip(headers, columns):
-		max_cell = max([len(cell) for cell in col] + [len(header)])
-		desired_widths.append(min(max(18, max_cell + 2), 36))
+def _column_width(header: str, col: List[str]) -> int:
+	max_cell = max(max(map(len, col), default=0), len(header))
+	return min(max(18, max_cell + 2), 36)
+
+
+def _segment_columns(headers: List[str], columns: List[List[str]], max_width: int) -> List[Tuple[List[str], List[List[str]], List[int]]]:
+	# Compute desired widths per column once; each segment carries its slice
+	desired_widths = [_column_width(header, col) for header, col in zip(headers, columns)]
 
 	segments = []
 	i = 0
@@ -54,74 +55,72 @@ def _segment_columns(headers: List[str], columns: List[List[str]], max_width: in
 		if j == i:
 			# ensure at least one column per segment
 			j = i + 1
-		seg_headers = headers[i:j]
-		seg_columns = columns[i:j]
-		segments.append((seg_headers, seg_columns))
+		segments.append((headers[i:j], columns[i:j], desired_widths[i:j]))
 		i = j
 	return segments
 
 
-def _format_grid_box(headers: List[str], columns: List[List[str]], term_width: int) -> str:
-	# Normalize column heights for each segment separately
+def _grid_box_lines(headers: List[str], columns: List[List[str]], term_width: int) -> Iterator[str]:
+	# Normalize column heights for each segment separately; segments are
+	# separated by one blank line
 	segments = _segment_columns(headers, columns, term_width)
-	rendered_segments = []
-	for seg_headers, seg_columns in segments:
-		# Determine widths
-		col_widths = []
-		for header, col in zip(seg_headers, seg_columns):
-			max_cell = max([len(cell) for cell in col] + [len(header)])
-			col_widths.append(min(max(18, max_cell + 2), 36))
+	for seg_idx, (seg_headers, seg_columns, col_widths) in enumerate(segments):
+		if seg_idx:
+			yield ""
+		rules = ["─" * w for w in col_widths]
+
+		# Build top border, header and separator
+		yield "┌" + "┬".join(rules) + "┐"
+		yield "│" + "│".join(h[:w].center(w) for h, w in zip(seg_headers, col_widths)) + "│"
+		yield "├" + "┼".join(rules) + "┤"
 
 		max_rows = max(len(col) for col in seg_columns) if seg_columns else 0
-		seg_columns_norm = []
-		for col in seg_columns:
-			if len(col) < max_rows:
-				seg_columns_norm.append(col + [""] * (max_rows - len(col)))
-			else:
-				seg_columns_norm.append(col)
-
-		# Build top border
-		top = "┌" + "┬".join("─" * w for w in col_widths) + "┐"
-		header_cells = [h[:w].center(w) for h, w in zip(seg_headers, col_widths)]
-		header_line = "│" + "│".join(header_cells) + "│"
-		sep = "├" + "┼".join("─" * w for w in col_widths) + "┤"
-
-		lines = [top, header_line, sep]
 		for row_idx in range(max_rows):
-			row_cells = []
-			for col_idx, col in enumerate(seg_columns_norm):
-				width = col_widths[col_idx]
-				cell = col[row_idx][:width]
-				row_cells.append(cell.ljust(width))
-			lines.append("│" + "│".join(row_cells) + "│")
-		bottom = "└" + "┴".join("─" * w for w in col_widths) + "┘"
-		lines.append(bottom)
-		rendered_segments.append("\n".join(lines))
-
-	return "\n\n".join(rendered_segments)
+			yield "│" + "│".join(
+				(col[row_idx][:width] if row_idx < len(col) else "").ljust(width)
+				for col, width in zip(seg_columns, col_widths)
+			) + "│"
+		yield "└" + "┴".join(rules) + "┘"
 
 
 def _rows_to_lines(roster_rows) -> List[str]:
 	lines = []
+	append = lines.append
 	for row in roster_rows:
-		if row.player:
-			# Example: "F: Player Name (TEAM)"
-			team_short = getattr(row.player, "team_short_name", getattr(row.player, "team_short", ""))
-			lines.append(f"{row.pos.short_name}: {row.player.name} {f'({team_short})' if team_short else ''}")
+		player = row.player
+		if player:
+			# Example: "F: Player Name (TEAM)"; team_short is only consulted
+			# when team_short_name is missing
+			team_short = getattr(player, "team_short_name", None)
+			if team_short is None:
+				team_short = getattr(player, "team_short", "")
+			append(f"{row.pos.short_name}: {player.name} ({team_short})" if team_short else f"{row.pos.short_name}: {player.name} ")
 		else:
-			lines.append(f"{row.pos.short_name}: Empty")
+			append(f"{row.pos.short_name}: Empty")
 	return lines
 
 
+# Standings keys hinting at divisions/groups/conferences ("div" also covers "division")
+_DIV_TOKENS = ("div", "conference", "group")
+# league_id -> (monotonic time, divisions); divisions rarely change mid-season
+_DIV_CACHE: Dict[str, Tuple[float, Dict[str, List[str]]]] = {}
+_DIV_TTL = 3600.0
+
+
 def _detect_divisions(api: FantraxAPI) -> Dict[str, List[str]]:
 	"""Return mapping of division name -> list of team_ids.
 
 	Falls back to a single group 'All Teams' if divisions cannot be detected.
+	Results are cached per league for _DIV_TTL seconds.
 	"""
+	hit = _DIV_CACHE.get(api.league_id)
+	if hit and time.monotonic() - hit[0] < _DIV_TTL:
+		return hit[1]
+
 	try:
 		resp = api._request("getStandings")	 # Use base standings
 	except Exception:
-		# If any issue, return single group
+		# If any issue, return single group (not cached, so the next call retries)
 		return {"All Teams": [t.team_id for t in api.teams]}
 
 	team_info = resp.get("fantasyTeamInfo", {})
@@ -131,7 +130,7 @@ def _detect_divisions(api: FantraxAPI) -> Dict[str, List[str]]:
 		# Heuristics: look for fields that imply divisions/groups/conferences
 		for key, value in info.items():
 			lk = key.lower()
-			if any(tok in lk for tok in ["division", "div", "conference", "group"]):
+			if any(tok in lk for tok in _DIV_TOKENS):
 				# Value may be a string or an object with name
 				if isinstance(value, str):
 					div_name = value
@@ -144,10 +143,7 @@ def _detect_divisions(api: FantraxAPI) -> Dict[str, List[str]]:
 			div_name = "All Teams"
 		divisions.setdefault(div_name, []).append(team_id)
 
-	# If we ended up with only 'All Teams', keep as is
-	if len(divisions) == 1 and "All Teams" in divisions:
-		return divisions
-
+	_DIV_CACHE[api.league_id] = (time.monotonic(), divisions)
 	return divisions
 
 
@@ -184,11 +180,11 @@ def format_side_by_side(api: FantraxAPI, include_bench: bool = False) -> str:
 
 		output_lines.append("")
 		output_lines.append(f"{div_name}")
-		output_lines.append(_format_grid_box(headers, starter_columns, term_width))
+		output_lines.extend(_grid_box_lines(headers, starter_columns, term_width))
 		if include_bench:
 			output_lines.append("")
 			output_lines.append("Bench")
-			output_lines.append(_format_grid_box(headers, bench_columns, term_width))
+			output_lines.extend(_grid_box_lines(headers, bench_columns, term_width))
 
 	return "\n".join(output_lines)
 
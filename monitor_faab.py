@@ -1,30 +1,38 @@
 #!/usr/bin/env python3
 import os
-import pickle
+import sys
 from datetime import datetime
 from fantraxapi import FantraxAPI
 from requests import Session
+from utils.cookie_import import load_cookie_dict
+from utils.fantrax_config import read_fantrax_section
 
 def load_session(cookie_path="fantraxloggedin.cookie"):
 	"""Load authenticated session from cookie file."""
 	session = Session()
-	with open(cookie_path, "rb") as f:
-		for cookie in pickle.load(f):
-			session.cookies.set(cookie["name"], cookie["value"])
+	session.cookies.update(load_cookie_dict(cookie_path))
 	return session
 
-def format_tables(api, budgets):
-	"""Format budgets and claim info into pretty tables."""
-	# Collect all info first
-	team_info = {}
-	for team_id, budget in budgets.items():
-		team = api.team(team_id)
-		claim_info = api.league.get_claim_info(team_id)
-		team_info[team_id] = {
-			'team': team,
+def format_tables(api, budgets, out=None):
+	"""Format budgets and claim info into pretty tables.
+
+	When out is given the rows are streamed to it and None is returned,
+	instead of joining them into one string.
+	"""
+	# Collect all info first; every team's pending claims share one request,
+	# league claim settings are reused from faab_budgets() and teams come from
+	# the already-loaded team list
+	overview = api.league.get_claims_overview(list(budgets))
+	settings = overview['settings']
+	teams_by_id = {team.team_id: team for team in api.teams}
+	team_info = {
+		team_id: {
+			'team': teams_by_id[team_id],
 			'budget': budget,
-			'claims': claim_info
+			'pending': overview['pendingClaims'][team_id]
 		}
+		for team_id, budget in budgets.items()
+	}
 	
 	# Format FAAB table
 	faab_rows = []
@@ -35,20 +43,23 @@ def format_tables(api, budgets):
 	# Track all pending claims for details section
 	all_claims = []
 	
-	for team_id, info in sorted(team_info.items(), key=lambda x: x[1]['budget']['value'], reverse=True):
+	# Precompute sort keys so the sort calls a C-level dict lookup, not a lambda
+	budget_values = {team_id: budget['value'] for team_id, budget in budgets.items()}
+	for team_id in sorted(team_info, key=budget_values.__getitem__, reverse=True):
+		info = team_info[team_id]
 		# Get process date from first claim if any
+		pending = info['pending']
 		next_process = ""
-		if info['claims'].get('pendingClaims'):
-			all_claims.extend(info['claims']['pendingClaims'])
-			next_process = info['claims']['pendingClaims'][0]['process_date']
-		if info['claims']['pendingClaims']:
-			next_process = info['claims']['pendingClaims'][0]['process_date']
-			
+		if pending:
+			all_claims.extend(pending)
+			next_process = pending[0]['process_date']
+
+		budget = info['budget']
 		faab_rows.append(
 			f"{info['team'].name[:30]:<30} "
-			f"{info['budget']['display']:>10} "
-			f"{str(info['budget']['tradeable']):>9} "
-			f"{len(info['claims']['pendingClaims']):>6} "
+			f"{budget['display']:>10} "
+			f"{str(budget['tradeable']):>9} "
+			f"{len(pending):>6} "
 			f"{next_process:>25}"
 		)
 	
@@ -56,23 +67,20 @@ def format_tables(api, budgets):
 	
 	# Format league settings and pending claims
 	detail_rows = []
-	# Take settings from first team since they're league-wide
-	first_team = next(iter(team_info.values()))
-	
 	# League settings
 	detail_rows.append("\nLeague Claim Settings")
 	detail_rows.append("=" * 50)
 	
-	claim_types = first_team['claims']['claimTypes']
+	claim_types = settings['claimTypes']
 	detail_rows.append(f"Claim Types:")
 	for code, name in claim_types.items():
 		detail_rows.append(f"  - {name}")
 	
-	detail_rows.append(f"\nClaim Groups Enabled: {first_team['claims']['claimGroupsEnabled']}")
-	detail_rows.append(f"FAAB Bidding Enabled: {first_team['claims']['showBidColumn']}")
+	detail_rows.append(f"\nClaim Groups Enabled: {settings['claimGroupsEnabled']}")
+	detail_rows.append(f"FAAB Bidding Enabled: {settings['showBidColumn']}")
 	
-	if 'miscData' in first_team['claims']:
-		misc = first_team['claims']['miscData']
+	if 'miscData' in settings:
+		misc = settings['miscData']
 		if 'allowGroupChanges' in misc:
 			detail_rows.append(f"Allow Group Changes: {misc['allowGroupChanges']}")
 		if 'showAllTeamsChoice' in misc:
@@ -82,7 +90,7 @@ def format_tables(api, budgets):
 	
 	# Pending claims details
 	for team_id, info in team_info.items():
-		claims = info['claims']['pendingClaims']
+		claims = info['pending']
 		if claims:
 			detail_rows.append(f"\nPending Claims for {info['team'].name}:")
 			detail_rows.append("-" * 50)
@@ -104,20 +112,18 @@ def format_tables(api, budgets):
 	
 	detail_rows.append("=" * 50)
 	
-	return "\n".join(faab_rows + detail_rows)
+	rows = faab_rows + detail_rows
+	if out is not None:
+		out.writelines(f"{row}\n" for row in rows)
+		return None
+	return "\n".join(rows)
 
 def load_config(config_path="config.ini"):
-	"""Load configuration from config.ini."""
-	import configparser
-	config = configparser.ConfigParser()
-	config.read(config_path)
-	
-	if "fantrax" not in config:
-		raise ValueError("config.ini must have a [fantrax] section")
-		
+	"""Load configuration from the [fantrax] section of config.ini."""
+	values = read_fantrax_section(config_path)
 	return {
-		"league_id": config["fantrax"]["league_id"],
-		"cookie_path": config["fantrax"]["cookie_path"]
+		"league_id": values["league_id"],
+		"cookie_path": values["cookie_path"]
 	}
 
 def main():
@@ -131,7 +137,7 @@ def main():
 	# Get all FAAB budgets and format tables
 	print(f"\nLeague FAAB & Claims Status as of {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 	budgets = api.league.faab_budgets()
-	print(format_tables(api, budgets))
+	format_tables(api, budgets, out=sys.stdout)
 
 if __name__ == "__main__":
 	main()
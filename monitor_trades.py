@@ -1,41 +1,54 @@
 #!/usr/bin/env python3
+import functools
 import os
-import pickle
+import sys
 from datetime import datetime
 from fantraxapi import FantraxAPI
 from requests import Session
+from utils.cookie_import import load_cookie_dict
+from utils.fantrax_config import read_fantrax_section
 
 def load_session(cookie_path="fantraxloggedin.cookie"):
 	"""Load authenticated session from cookie file."""
 	session = Session()
-	with open(cookie_path, "rb") as f:
-		for cookie in pickle.load(f):
-			session.cookies.set(cookie["name"], cookie["value"])
+	session.cookies.update(load_cookie_dict(cookie_path))
 	return session
 
-def format_trade_moves(api, moves):
-	"""Format trade moves into readable text."""
+def _format_faab_move(move, from_team, to_team):
+	budget = move["budgetAmountObj"]
+	return f"FAAB: {from_team.name} → {to_team.name}: {budget['display']}"
+
+def _format_player_move(move, from_team, to_team):
+	player = move["scorer"]
+	return (
+		f"Player: {from_team.name} → {to_team.name}: "
+		f"{player['name']} ({player['posShortNames']}, {player['teamShortName']})"
+	)
+
+# Move payload key -> formatter; the first key present in a move wins
+_MOVE_FORMATTERS = {
+	"budgetAmountObj": _format_faab_move,
+	"scorer": _format_player_move,
+}
+
+def format_trade_moves(get_team, moves):
+	"""Format trade moves into readable text; get_team maps a team id to its Team."""
 	lines = []
 	for move in moves:
-		if "budgetAmountObj" in move:
-			# FAAB move
-			budget = move["budgetAmountObj"]
-			from_team = api.team(move["from"]["teamId"])
-			to_team = api.team(move["to"]["teamId"])
-			lines.append(f"FAAB: {from_team.name} → {to_team.name}: {budget['display']}")
-		elif "scorer" in move:
-			# Player move
-			player = move["scorer"]
-			from_team = api.team(move["from"]["teamId"])
-			to_team = api.team(move["to"]["teamId"])
-			lines.append(
-				f"Player: {from_team.name} → {to_team.name}: "
-				f"{player['name']} ({player['posShortNames']}, {player['teamShortName']})"
-			)
+		for key, formatter in _MOVE_FORMATTERS.items():
+			if key in move:
+				from_team = get_team(move["from"]["teamId"])
+				to_team = get_team(move["to"]["teamId"])
+				lines.append(formatter(move, from_team, to_team))
+				break
 	return lines
 
-def format_trade_info(api, trade):
-	"""Format a trade's details into readable text."""
+def format_trade_info(get_team, trade, out=None):
+	"""Format a trade's details into readable text; get_team maps a team id to its Team.
+
+	When out is given the lines are streamed to it and None is returned,
+	instead of joining them into one string.
+	"""
 	lines = []
 	lines.append("=" * 80)
 	
@@ -50,13 +63,13 @@ def format_trade_info(api, trade):
 	
 	# Moves
 	lines.append("\nMoves:")
-	lines.extend("	" + line for line in format_trade_moves(api, trade["moves"]))
+	lines.extend("	" + line for line in format_trade_moves(get_team, trade["moves"]))
 	
 	# Roster warnings
 	if "illegalRosterMsgs" in trade:
 		lines.append("\nRoster Warnings:")
 		for team_msgs in trade["illegalRosterMsgs"]:
-			team = api.team(team_msgs["teamId"])
+			team = get_team(team_msgs["teamId"])
 			lines.append(f"\n{team.name}:")
 			for period_msgs in team_msgs["messagesPerPeriod"]:
 				lines.append(f"	 {period_msgs['period']}:")
@@ -64,20 +77,17 @@ def format_trade_info(api, trade):
 					lines.append(f"	   - {msg}")
 	
 	lines.append("=" * 80)
+	if out is not None:
+		out.writelines(f"{line}\n" for line in lines)
+		return None
 	return "\n".join(lines)
 
 def load_config(config_path="config.ini"):
-	"""Load configuration from config.ini."""
-	import configparser
-	config = configparser.ConfigParser()
-	config.read(config_path)
-	
-	if "fantrax" not in config:
-		raise ValueError("config.ini must have a [fantrax] section")
-		
+	"""Load configuration from the [fantrax] section of config.ini."""
+	values = read_fantrax_section(config_path)
 	return {
-		"league_id": config["fantrax"]["league_id"],
-		"cookie_path": config["fantrax"]["cookie_path"]
+		"league_id": values["league_id"],
+		"cookie_path": values["cookie_path"]
 	}
 
 def main():
@@ -96,10 +106,15 @@ def main():
 		print("\nNo pending trades found.")
 		return
 		
-	for trade in trades:
-		# Get full trade details
-		details = api.trades.get_trade_details(trade.trade_id)
-		print(format_trade_info(api, details))
+	# Team lookups repeat across moves and trades; resolve each id once
+	get_team = functools.lru_cache(maxsize=None)(api.team)
+
+	# Get full trade details for every pending trade in one call
+	trade_ids = [trade.data.get("txSetId") for trade in trades]
+	details_by_id = api.trades.get_trade_details_bulk(trade_ids)
+	for trade_id in trade_ids:
+		if trade_id in details_by_id:
+			format_trade_info(get_team, details_by_id[trade_id], out=sys.stdout)
 
 if __name__ == "__main__":
 	main()
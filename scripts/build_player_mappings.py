@@ -3,6 +3,7 @@
 Script to help build player mappings from various data sources.
 """
 import argparse
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -10,15 +11,24 @@ import yaml
 
 from fantraxapi.player_mapping import PlayerMapping, PlayerMappingManager
 
+# The only scout picks columns this script reads
+SCOUT_COLUMNS = ["player_full_from_title", "player_display", "team_name", "position"]
+
 def load_scout_picks_data(data_dir: Path) -> pd.DataFrame:
 	"""Load the most recent scout picks data."""
-	# Find most recent parquet file
-	files = list(data_dir.glob("scout_picks_rosters_*.parquet"))
+	# Find most recent parquet file; scandir entries carry their stat, so
+	# this is one directory read rather than a stat() per export
+	with os.scandir(data_dir) as it:
+		files = [
+			e for e in it
+			if e.name.startswith("scout_picks_rosters_") and e.name.endswith(".parquet")
+		]
 	if not files:
 		raise FileNotFoundError("No scout picks data found")
 		
-	latest = max(files, key=lambda p: p.stat().st_mtime)
-	return pd.read_parquet(latest)
+	latest = max(files, key=lambda e: e.stat().st_mtime).path
+	# Parquet is columnar, so reading a subset skips the other columns on disk
+	return pd.read_parquet(latest, columns=SCOUT_COLUMNS)
 
 def build_mappings(data_dir: Path, output_file: Path) -> None:
 	"""
@@ -34,10 +44,11 @@ def build_mappings(data_dir: Path, output_file: Path) -> None:
 	# Load scout picks data
 	scout_df = load_scout_picks_data(data_dir / "silver/scout_picks")
 	
-	# Process each player
-	for _, row in scout_df.iterrows():
+	# Process each player; plain tuples over the SCOUT_COLUMNS we load avoid
+	# building a Series per row
+	for full, display, team, position in scout_df.itertuples(index=False, name=None):
 		# Get the full name if available, otherwise use display name
-		name = row["player_full_from_title"] or row["player_display"]
+		name = full or display
 		if not name:
 			continue
 			
@@ -52,13 +63,13 @@ def build_mappings(data_dir: Path, output_file: Path) -> None:
 		)
 		
 		# Add any alternate names
-		if row["player_display"] and row["player_display"] != name:
-			mapping.other_names.append(row["player_display"])
+		if display and display != name:
+			mapping.other_names.append(display)
 			
 		print(f"Found player: {name}")
-		print(f"  Display name: {row['player_display']}")
-		print(f"  Team: {row['team_name']}")
-		print(f"  Position: {row['position']}")
+		print(f"  Display name: {display}")
+		print(f"  Team: {team}")
+		print(f"  Position: {position}")
 		print("	 Enter Fantrax ID (or press Enter to skip):")
 		fantrax_id = input().strip()
 		if not fantrax_id:
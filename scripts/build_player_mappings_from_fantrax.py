@@ -3,6 +3,7 @@
 Script to build player mappings starting from Fantrax data.
 """
 import argparse
+import os
 from pathlib import Path
 import yaml
 
@@ -11,15 +12,24 @@ import pandas as pd
 from fantraxapi.fantrax import FantraxAPI
 from fantraxapi.player_mapping import PlayerMapping, PlayerMappingManager
 
+# The only scout picks columns this script reads
+SCOUT_COLUMNS = ["player_full_from_title", "player_display"]
+
 def load_scout_picks_data(data_dir: Path) -> pd.DataFrame:
 	"""Load the most recent scout picks data."""
-	# Find most recent parquet file
-	files = list(data_dir.glob("scout_picks_rosters_*.parquet"))
+	# Find most recent parquet file; scandir entries carry their stat, so
+	# this is one directory read rather than a stat() per export
+	with os.scandir(data_dir) as it:
+		files = [
+			e for e in it
+			if e.name.startswith("scout_picks_rosters_") and e.name.endswith(".parquet")
+		]
 	if not files:
 		raise FileNotFoundError("No scout picks data found")
 		
-	latest = max(files, key=lambda p: p.stat().st_mtime)
-	return pd.read_parquet(latest)
+	latest = max(files, key=lambda e: e.stat().st_mtime).path
+	# Parquet is columnar, so reading a subset skips the other columns on disk
+	return pd.read_parquet(latest, columns=SCOUT_COLUMNS)
 
 def build_mappings(league_id: str, data_dir: Path, output_file: Path) -> None:
 	"""
@@ -47,7 +57,17 @@ def build_mappings(league_id: str, data_dir: Path, output_file: Path) -> None:
 	except FileNotFoundError:
 		print("No FFScout data found")
 	
-	# Process each Fantrax player
+	# Index FFScout rows by both name columns in one dict, walking rows in file
+	# order, so each Fantrax player is an O(1) lookup; setdefault keeps the
+	# first row matching either column, as the old mask's iloc[0] did
+	scout_idx: dict = {}
+	if scout_df is not None:
+		for row in scout_df.to_dict("records"):
+			scout_idx.setdefault(row["player_full_from_title"], row)
+			scout_idx.setdefault(row["player_display"], row)
+	
+	# Process each Fantrax player; the YAML file is written once at the end
+	new_mappings = []
 	for player in fantrax_players:
 		# Create base mapping
 		mapping = PlayerMapping(
@@ -59,35 +79,29 @@ def build_mappings(league_id: str, data_dir: Path, output_file: Path) -> None:
 			other_names=[]
 		)
 		
-		# Add name variations
-		if player.first_name and player.last_name:
-			mapping.other_names.extend([
-				f"{player.first_name} {player.last_name}",
-				f"{player.last_name}, {player.first_name}",
-				player.last_name,
-				f"{player.first_name[0]}. {player.last_name}"
-			])
+		# Add name variations; a set drops duplicates as they are added
+		other_names = set()
+		first, last = player.first_name, player.last_name
+		if first and last:
+			other_names.update((
+				f"{first} {last}",
+				f"{last}, {first}",
+				last,
+				f"{first[0]}. {last}"
+			))
 		
-		# Try to match with FFScout data
-		if scout_df is not None:
-			# Try exact match on full name
-			scout_match = scout_df[
-				(scout_df["player_full_from_title"] == player.name) |
-				(scout_df["player_display"] == player.name)
-			]
-			
-			if not scout_match.empty:
-				row = scout_match.iloc[0]
-				mapping.ffscout_name = row["player_full_from_title"]
-				if row["player_display"] != row["player_full_from_title"]:
-					mapping.other_names.append(row["player_display"])
+		# Try to match with FFScout data on either name column
+		row = scout_idx.get(player.name)
+		if row is not None:
+			mapping.ffscout_name = row["player_full_from_title"]
+			if row["player_display"] != row["player_full_from_title"]:
+				other_names.add(row["player_display"])
 		
-		# Remove duplicates from other names
-		mapping.other_names = list(set(mapping.other_names))
-		
-		# Add to manager
-		manager.add_mapping(mapping)
+		mapping.other_names = list(other_names)
+		new_mappings.append(mapping)
 		
+	manager.add_mappings(new_mappings)
+	
 	print(f"\nCreated mappings for {len(fantrax_players)} players")
 	print(f"Saved to: {output_file}")
 
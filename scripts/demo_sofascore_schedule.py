@@ -1,53 +1,59 @@
 """
 Demo script to fetch and display the Premier League schedule for the current season using SofaScore.
 """
+import argparse
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime
 import logging
 from pathlib import Path
 
 import pandas as pd
 
-from fantraxapi.providers.sofascore.client import get_matches
-from fantraxapi.providers.sofascore.discover import get_season_events
+from fantraxapi.providers.sofascore.discover import get_season_events, make_client
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
 				   format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-async def get_current_schedule():
+async def get_current_schedule(client=None):
 	"""Fetch and format the current Premier League schedule."""
 	# Get all season events
 	logger.info("Fetching Premier League schedule for 2025-26 season...")
-	events = await get_season_events(season="2025-26")
+	events = await get_season_events(season="2025-26", client=client)
 	
-	# Convert events to DataFrame
-	schedule_data = []
+	# Convert events to DataFrame, collecting one list per column
+	starts, homes, aways, game_ids = [], [], [], []
+	rounds, weeks, home_scores, away_scores = [], [], [], []
 	for event in events:
-		schedule_data.append({
-			'date': datetime.fromtimestamp(event.start_timestamp, tz=timezone.utc),
-			'home_team': event.home_team['name'],
-			'away_team': event.away_team['name'],
-			'game_id': event.event_id,
-			'round': event.round_info.get('round', ''),
-			'week': event.round,
-			'home_score': event.home_score,
-			'away_score': event.away_score
-		})
+		starts.append(event.start_timestamp)
+		homes.append(event.home_team['name'])
+		aways.append(event.away_team['name'])
+		game_ids.append(event.event_id)
+		rounds.append(event.round_info.get('round', ''))
+		weeks.append(event.round)
+		home_scores.append(event.home_score)
+		away_scores.append(event.away_score)
 	
-	df = pd.DataFrame(schedule_data)
+	df = pd.DataFrame({
+		'date': starts,
+		'home_team': homes,
+		'away_team': aways,
+		'game_id': game_ids,
+		'round': rounds,
+		'week': weeks,
+		'home_score': home_scores,
+		'away_score': away_scores
+	})
 	
-	# Sort by date
+	# Sort by the raw epoch seconds, then convert and format the column once
 	df = df.sort_values('date')
-	
-	# Format date column
-	df['date'] = df['date'].dt.strftime('%Y-%m-%d %H:%M UTC')
+	df['date'] = pd.to_datetime(df['date'], unit='s', utc=True).dt.strftime('%Y-%m-%d %H:%M UTC')
 	
 	return df
 
-def save_schedule(df: pd.DataFrame, output_dir: Path):
-	"""Save schedule to CSV and Parquet formats."""
+def save_schedule(df: pd.DataFrame, output_dir: Path, write_csv: bool = False):
+	"""Save schedule to Parquet, and to CSV too when write_csv is set."""
 	# Create output directory if it doesn't exist
 	output_dir.mkdir(parents=True, exist_ok=True)
 	
@@ -55,20 +61,30 @@ def save_schedule(df: pd.DataFrame, output_dir: Path):
 	timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 	base_name = f'premier_league_schedule_{timestamp}'
 	
-	# Save as CSV
-	csv_path = output_dir / f'{base_name}.csv'
-	df.to_csv(csv_path, index=False)
-	logger.info(f"Schedule saved to CSV: {csv_path}")
+	# Save as CSV only on request; nothing downstream reads it
+	if write_csv:
+		csv_path = output_dir / f'{base_name}.csv'
+		df.to_csv(csv_path, index=False)
+		logger.info(f"Schedule saved to CSV: {csv_path}")
 	
 	# Save as Parquet
 	parquet_path = output_dir / f'{base_name}.parquet'
-	df.to_parquet(parquet_path, index=False)
+	df.to_parquet(parquet_path, index=False, compression='zstd')
 	logger.info(f"Schedule saved to Parquet: {parquet_path}")
 
 async def main():
+	parser = argparse.ArgumentParser(description="Fetch and display the Premier League schedule")
+	parser.add_argument(
+		"--csv",
+		action="store_true",
+		help="Also write the schedule as CSV"
+	)
+	args = parser.parse_args()
+	
 	try:
-		# Get schedule
-		df = await get_current_schedule()
+		# Get schedule over one pooled client
+		async with make_client() as client:
+			df = await get_current_schedule(client)
 		
 		# Display summary
 		logger.info("\nSchedule Summary:")
@@ -84,7 +100,7 @@ async def main():
 		
 		# Save to files
 		output_dir = Path('data/schedule')
-		save_schedule(df, output_dir)
+		save_schedule(df, output_dir, write_csv=args.csv)
 		
 	except Exception as e:
 		logger.error(f"Error fetching schedule: {e}")
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 try:
@@ -18,48 +19,64 @@ def jn(p):	# jersey number helper
 def pos(p):	 # position helper
 	return getattr(p, "position", None) or "?"
 
+def player_line(info):	# "- [7] Name (M)" display line
+	name = getattr(info, "name", None) or getattr(info, "short_name", None) or "Unknown"
+	return f"- [{jn(info)}] {name} ({pos(info)})"
+
 def print_team(title, team):
 	print(f"\n{title}")
 	print(f"Formation: {getattr(team, 'formation', '') or 'N/A'}")
 
-	players = list(getattr(team, "players", []) or [])
-	starters = [pl for pl in players if not getattr(pl, "substitute", False)]
-	subs	 = [pl for pl in players if getattr(pl, "substitute", False)]
+	# Partition starters/subs in one pass, keeping each player's info
+	starters, subs = [], []
+	for pl in getattr(team, "players", []) or []:
+		(subs if getattr(pl, "substitute", False) else starters).append(getattr(pl, "info", None))
 
 	print("\nStarting XI:")
-	for pl in starters[:11]:
-		info = getattr(pl, "info", None)
-		name = getattr(info, "name", None) or getattr(info, "short_name", None) or "Unknown"
-		print(f"- [{jn(info)}] {name} ({pos(info)})")
+	for info in starters[:11]:
+		print(player_line(info))
 
 	if subs:
 		print("\nSubstitutes:")
-		for pl in subs:
-			info = getattr(pl, "info", None)
-			name = getattr(info, "name", None) or getattr(info, "short_name", None) or "Unknown"
-			print(f"- [{jn(info)}] {name} ({pos(info)})")
+		for info in subs:
+			print(player_line(info))
 	else:
 		print("\nSubstitutes: (none)")
 
 
-def print_lineups_for_event(client, event_id: int):
-	lu = client.get_match_lineups(event_id)	 # returns Lineups dataclass
+def print_lineups(lu):
 	status = "confirmed" if getattr(lu, "confirmed", False) else "preliminary"
 	print(f"\nLineup Status: {status}")
 	print_team("Home", getattr(lu, "home", None))
 	print_team("Away", getattr(lu, "away", None))
 
 
+def print_lineups_for_event(client, event_id: int):
+	print_lineups(client.get_match_lineups(event_id))	 # returns Lineups dataclass
+
+
+def print_lineups_for_events(client, event_ids):
+	"""Fetch lineups for several events concurrently, then print them in order."""
+	with ThreadPoolExecutor(max_workers=min(8, len(event_ids))) as pool:
+		lineups = list(pool.map(client.get_match_lineups, event_ids))
+	for event_id, lu in zip(event_ids, lineups):
+		print(f"\n=== Event {event_id} ===")
+		print_lineups(lu)
+
+
 def main():
 	ap = argparse.ArgumentParser(description="Print SofaScore lineups via EasySoccerData")
-	ap.add_argument("--event-id", type=int, help="SofaScore event ID (e.g. 14025088)")
+	ap.add_argument("--event-id", type=int, nargs="+", help="SofaScore event ID(s) (e.g. 14025088)")
 	ap.add_argument("--live", action="store_true", help="Use first live event if no --event-id")
 	args = ap.parse_args()
 
 	client = esd.SofascoreClient()
 
 	if args.event_id:
-		print_lineups_for_event(client, args.event_id)
+		if len(args.event_id) == 1:
+			print_lineups_for_event(client, args.event_id[0])
+		else:
+			print_lineups_for_events(client, args.event_id)
 		return
 
 	if args.live:
@@ -4,7 +4,10 @@ Fetch and save all Premier League games for the season.
 """
 import argparse
 import asyncio
+import json
+import time
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -20,15 +23,20 @@ USER_AGENT = "Mozilla/5.0 (analytics/lineups)"
 PREMIER_LEAGUE_ID = 17
 PREMIER_LEAGUE_NAME = "Premier League"
 
-class Event:
-	"""SofaScore event."""
-	def __init__(self, **kwargs):
-		self.event_id = kwargs.get("id")
-		self.tournament_id = kwargs.get("tournament", {}).get("id")
-		self.tournament_name = kwargs.get("tournament", {}).get("name")
-		self.kickoff_utc = kwargs.get("startTimestamp")
-		self.home_team = kwargs.get("homeTeam", {})
-		self.away_team = kwargs.get("awayTeam", {})
+# Day requests in flight at once; tenacity's backoff in get_json absorbs 429s
+MAX_CONCURRENT_DAYS = 16
+
+# Raw day responses are cached on disk; a copy written two or more days after
+# the day it covers never changes, any other copy is refetched once it is this
+# old (seconds)
+DAY_CACHE_TTL = 10 * 60
+
+# Saved schedule layout; SofaScore team and tournament ids fit in int32
+SCHEDULE_COLUMNS = [
+	"event_id", "tournament_id", "tournament_name", "kickoff_utc",
+	"home_team_id", "home_team_name", "away_team_id", "away_team_name"
+]
+SCHEDULE_DTYPES = {"tournament_id": "int32", "home_team_id": "int32", "away_team_id": "int32"}
 
 def get_season_dates(season: str) -> Tuple[datetime, datetime]:
 	"""
@@ -58,6 +66,31 @@ async def get_json(client: httpx.AsyncClient, url: str) -> dict:
 	r.raise_for_status()
 	return r.json()
 
+def read_day_cache(cache_file: Path, date_utc: datetime) -> Optional[dict]:
+	"""
+	Return a cached scheduled-events response if it is still usable.
+	
+	Whether the day had settled is judged by when the file was written, so a
+	copy fetched before (or on) the day still expires after DAY_CACHE_TTL.
+	
+	Args:
+		cache_file: Cached JSON for the day
+		date_utc: Day the response covers
+	
+	Returns:
+		Parsed response, or None if missing, stale or unreadable
+	"""
+	if not cache_file.exists():
+		return None
+	mtime = cache_file.stat().st_mtime
+	settled = mtime > (date_utc + timedelta(days=2)).timestamp()
+	if not settled and time.time() - mtime > DAY_CACHE_TTL:
+		return None
+	try:
+		return json.loads(cache_file.read_text())
+	except ValueError:
+		return None
+
 def utc_ts_to_dt(ts: int) -> datetime:
 	"""Convert SofaScore timestamp to UTC datetime."""
 	return datetime.fromtimestamp(ts, tz=timezone.utc)
@@ -85,26 +118,26 @@ def is_premier_league_game(event: Dict) -> bool:
 		event.get("awayTeam")
 	)
 
-def get_event_key(event: Dict) -> str:
+def get_event_key(event: Dict, kickoff_utc: datetime) -> str:
 	"""
 	Get unique key for event to deduplicate.
 	
 	Args:
 		event: Event data from SofaScore API
+		kickoff_utc: The event's converted startTimestamp
 	
 	Returns:
 		str: Unique key combining home team, away team, and date
 	"""
-	# Convert timestamp to date string
-	date = utc_ts_to_dt(event["startTimestamp"]).date().isoformat()
 	# Include home/away order to preserve both fixtures
-	return f"{date}_{event['homeTeam']['id']}_vs_{event['awayTeam']['id']}"
+	return f"{kickoff_utc.date().isoformat()}_{event['homeTeam']['id']}_vs_{event['awayTeam']['id']}"
 
 async def get_scheduled_events(
 	client: httpx.AsyncClient,
 	date_utc: Optional[datetime] = None,
-	verbose: bool = False
-) -> List[Event]:
+	verbose: bool = False,
+	cache_dir: Optional[Path] = None
+) -> List[Dict]:
 	"""
 	Get scheduled Premier League events for given date.
 	
@@ -112,16 +145,22 @@ async def get_scheduled_events(
 		client: httpx AsyncClient instance
 		date_utc: Target date (defaults to today)
 		verbose: Print detailed logging
+		cache_dir: Directory for raw day responses (no caching if None)
 	
 	Returns:
-		List of Event instances
+		List of flat event records keyed by SCHEDULE_COLUMNS
 	"""
 	date_utc = date_utc or datetime.now(tz=timezone.utc)
 	date_str = date_utc.strftime("%Y-%m-%d")
 	
-	# Get events from SofaScore API
-	url = f"{API_BASE}/sport/football/scheduled-events/{date_str}"
-	data = await get_json(client, url)
+	# Get events from the day cache, else from SofaScore API
+	cache_file = cache_dir / f"{date_str}.json" if cache_dir else None
+	data = read_day_cache(cache_file, date_utc) if cache_file else None
+	if data is None:
+		url = f"{API_BASE}/sport/football/scheduled-events/{date_str}"
+		data = await get_json(client, url)
+		if cache_file:
+			cache_file.write_text(json.dumps(data))
 	events = data.get("events", [])
 	
 	if verbose:
@@ -132,61 +171,81 @@ async def get_scheduled_events(
 	result = []
 	for e in events:
 		if is_premier_league_game(e):
+			# Convert timestamp to datetime once; the response is left untouched
+			kickoff_utc = utc_ts_to_dt(e["startTimestamp"])
+			
 			# Use event key to deduplicate
-			key = get_event_key(e)
+			key = get_event_key(e, kickoff_utc)
 			if key not in seen_keys:
 				seen_keys.add(key)
-				
-				# Convert timestamp to datetime
-				e["startTimestamp"] = utc_ts_to_dt(e["startTimestamp"])
-				
-				result.append(Event(**e))
+				tournament = e.get("tournament", {})
+				home, away = e["homeTeam"], e["awayTeam"]
+				result.append({
+					"event_id": e.get("id"),
+					"tournament_id": tournament.get("id"),
+					"tournament_name": tournament.get("name"),
+					"kickoff_utc": kickoff_utc,
+					"home_team_id": home["id"],
+					"home_team_name": home["name"],
+					"away_team_id": away["id"],
+					"away_team_name": away["name"]
+				})
 	
 	if verbose and result:
 		print(f"- Premier League games:")
 		for e in result:
-			print(f"  • {e.kickoff_utc.strftime('%H:%M')} {e.home_team['name']} vs {e.away_team['name']}")
+			print(f"  • {e['kickoff_utc'].strftime('%H:%M')} {e['home_team_name']} vs {e['away_team_name']}")
 	
 	return result
 
 async def get_season_events(
 	season: str = "2025-26",
-	verbose: bool = False
-) -> List[Event]:
+	verbose: bool = False,
+	cache_dir: Optional[Path] = None
+) -> List[Dict]:
 	"""
 	Get all Premier League events for the season.
 	
 	Args:
 		season: Season in format "2025-26" (defaults to 2025-26)
 		verbose: Print detailed logging
+		cache_dir: Directory for raw day responses (no caching if None)
 	
 	Returns:
-		List of Event instances sorted by kickoff time
+		List of event records sorted by kickoff time
 	"""
 	season_start, season_end = get_season_dates(season)
-	
-	all_events = []
-	current_date = season_start
+	dates = [season_start + timedelta(days=i) for i in range((season_end - season_start).days + 1)]
 	
 	print(f"\nFetching Premier League {season} season games from {season_start.date()} to {season_end.date()}")
 	
-	async with httpx.AsyncClient() as client:
-		while current_date <= season_end:
-			events = await get_scheduled_events(client, current_date, verbose)
-			if events:
-				print(f"Found {len(events)} Premier League games on {current_date.date()}")
-				all_events.extend(events)
-			current_date += timedelta(days=1)
-			# Small delay to avoid rate limiting
-			await asyncio.sleep(0.5)
+	if cache_dir:
+		cache_dir.mkdir(parents=True, exist_ok=True)
+	
+	# Fetch every day concurrently, at most MAX_CONCURRENT_DAYS at a time
+	sem = asyncio.Semaphore(MAX_CONCURRENT_DAYS)
+	limits = httpx.Limits(max_connections=MAX_CONCURRENT_DAYS, max_keepalive_connections=MAX_CONCURRENT_DAYS)
+	
+	async def fetch(day: datetime) -> List[Dict]:
+		async with sem:
+			return await get_scheduled_events(client, day, verbose, cache_dir)
+	
+	async with httpx.AsyncClient(limits=limits) as client:
+		results = await asyncio.gather(*(fetch(day) for day in dates))
+	
+	all_events = []
+	for day, events in zip(dates, results):
+		if events:
+			print(f"Found {len(events)} Premier League games on {day.date()}")
+			all_events.extend(events)
 	
 	# Sort by kickoff time
-	all_events.sort(key=lambda e: e.kickoff_utc)
+	all_events.sort(key=itemgetter("kickoff_utc"))
 	
 	# Group by matchday
 	matchdays = {}
 	for e in all_events:
-		date = e.kickoff_utc.date()
+		date = e["kickoff_utc"].date()
 		if date not in matchdays:
 			matchdays[date] = []
 		matchdays[date].append(e)
@@ -206,25 +265,20 @@ def deduplicate_schedule(df: pd.DataFrame) -> pd.DataFrame:
 		Deduplicated DataFrame
 	"""
 	# Create a date column for grouping into matchweeks
-	df['date'] = pd.to_datetime(df['kickoff_utc']).dt.date
+	df = df.assign(date=df['kickoff_utc'].dt.date)
 	
 	# Sort by kickoff time to keep the earliest time for each game
 	df = df.sort_values('kickoff_utc')
 	
-	# Create a unique game identifier that preserves home/away order
-	df['game_id'] = df.apply(
-		lambda x: f"{x['date']}_{x['home_team_id']}_vs_{x['away_team_id']}",
-		axis=1
-	)
-	
-	# Drop duplicates keeping first occurrence (earliest time)
+	# Drop duplicates of the same date and home/away pairing, keeping the
+	# first occurrence (earliest time)
 	df = df.drop_duplicates(
-		subset=['game_id'],
+		subset=['date', 'home_team_id', 'away_team_id'],
 		keep='first'
 	)
 	
-	# Drop temporary columns
-	df = df.drop(['date', 'game_id'], axis=1)
+	# Drop temporary column
+	df = df.drop('date', axis=1)
 	
 	return df
 
@@ -250,41 +304,43 @@ def validate_schedule(df: pd.DataFrame) -> bool:
 		print(f"WARNING: Expected 380 total games but found {total_games}")
 		is_valid = False
 	
-	# Count games per team
+	# Count games per team with one value_counts per side
 	print("\nGames per team:")
-	all_teams = sorted(set(df['home_team_name'].unique()) | set(df['away_team_name'].unique()))
-	for team in all_teams:
-		home = len(df[df['home_team_name'] == team])
-		away = len(df[df['away_team_name'] == team])
-		total = home + away
-		print(f"- {team}: {total} games ({home} home, {away} away)")
+	home, away = df['home_team_name'], df['away_team_name']
+	home_counts = home.value_counts()
+	away_counts = away.value_counts()
+	all_teams = home_counts.index.union(away_counts.index)	# sorted
+	home_counts = home_counts.reindex(all_teams, fill_value=0)
+	away_counts = away_counts.reindex(all_teams, fill_value=0)
+	for team, home_games, away_games in zip(all_teams, home_counts, away_counts):
+		total = home_games + away_games
+		print(f"- {team}: {total} games ({home_games} home, {away_games} away)")
 		if total != 38:
 			print(f"  WARNING: Expected 38 games but found {total}")
 			is_valid = False
-		if home != 19:
-			print(f"  WARNING: Expected 19 home games but found {home}")
+		if home_games != 19:
+			print(f"  WARNING: Expected 19 home games but found {home_games}")
 			is_valid = False
-		if away != 19:
-			print(f"  WARNING: Expected 19 away games but found {away}")
+		if away_games != 19:
+			print(f"  WARNING: Expected 19 away games but found {away_games}")
 			is_valid = False
 	
-	# Check for duplicate fixtures
-	df['fixture'] = df.apply(
-		lambda x: tuple(sorted([x['home_team_name'], x['away_team_name']])),
-		axis=1
-	)
-	fixture_counts = df.groupby('fixture').size()
+	# Check for duplicate fixtures; order each pairing alphabetically so home
+	# and away legs share a key
+	home_first = home <= away
+	team_a = home.where(home_first, away)
+	team_b = away.where(home_first, home)
+	fixture_counts = df.groupby([team_a, team_b]).size()
 	duplicates = fixture_counts[fixture_counts != 2]  # Each team should play home and away
 	if not duplicates.empty:
 		print("\nWARNING: Found irregular fixtures:")
 		for fixture, count in duplicates.items():
 			print(f"- {' vs '.join(fixture)}: {count} times (expected 2)")
-			games = df[df['fixture'] == fixture].sort_values('kickoff_utc')
+			games = df[(team_a == fixture[0]) & (team_b == fixture[1])].sort_values('kickoff_utc')
 			for _, row in games.iterrows():
 				print(f"  • {row['kickoff_utc']}: {row['home_team_name']} vs {row['away_team_name']}")
 		is_valid = False
 	
-	df = df.drop('fixture', axis=1)
 	return is_valid
 
 async def main():
@@ -302,6 +358,17 @@ async def main():
 		default="data/schedule",
 		help="Directory to save schedule (default: data/schedule)"
 	)
+	parser.add_argument(
+		"--cache-dir",
+		type=str,
+		default="data/cache/sofascore/scheduled-events",
+		help="Directory for cached daily responses (default: data/cache/sofascore/scheduled-events)"
+	)
+	parser.add_argument(
+		"--no-cache",
+		action="store_true",
+		help="Always refetch every day from SofaScore"
+	)
 	parser.add_argument(
 		"--verbose",
 		action="store_true",
@@ -310,28 +377,19 @@ async def main():
 	args = parser.parse_args()
 	
 	# Get all games
-	events = await get_season_events(season=args.season, verbose=args.verbose)
+	cache_dir = None if args.no_cache else Path(args.cache_dir)
+	events = await get_season_events(season=args.season, verbose=args.verbose, cache_dir=cache_dir)
 	
 	if not events:
 		print(f"\nNo Premier League games found for {args.season} season")
 		return
 	
-	# Convert to DataFrame
-	records = []
-	for e in events:
-		records.append({
-			"event_id": e.event_id,
-			"tournament_id": e.tournament_id,
-			"tournament_name": e.tournament_name,
-			"kickoff_utc": e.kickoff_utc,
-			"home_team_id": e.home_team["id"],
-			"home_team_name": e.home_team["name"],
-			"away_team_id": e.away_team["id"],
-			"away_team_name": e.away_team["name"],
-			"season": args.season
-		})
-	
-	df = pd.DataFrame(records)
+	# Convert to DataFrame straight from the records; the season is one constant column
+	df = pd.DataFrame.from_records(events, columns=SCHEDULE_COLUMNS)
+	df = df.astype(SCHEDULE_DTYPES)
+	df["season"] = args.season
+	# Convert kickoff times once; dedup, validation and display all read this column
+	df["kickoff_utc"] = pd.to_datetime(df["kickoff_utc"], utc=True)
 	
 	# Deduplicate schedule
 	df = deduplicate_schedule(df)
@@ -355,12 +413,13 @@ async def main():
 	pd.set_option('display.width', None)
 	pd.set_option('display.max_columns', None)
 	
-	# Group by month for cleaner display
-	df['month'] = df['kickoff_utc'].dt.strftime('%B %Y')
-	for month, month_df in df.groupby('month'):
-		print(f"\n{month}:")
+	# Group by calendar month for cleaner display; periods group as integers
+	# and only each group's label is formatted. Rows are already in kickoff
+	# order from deduplicate_schedule.
+	months = df['kickoff_utc'].dt.tz_localize(None).dt.to_period('M')
+	for month, month_df in df.groupby(months):
+		print(f"\n{month.strftime('%B %Y')}:")
 		display_df = month_df[["kickoff_utc", "home_team_name", "away_team_name"]]
-		display_df = display_df.sort_values('kickoff_utc')
 		print(display_df.to_string(index=False))
 
 if __name__ == "__main__":
@@ -0,0 +1,30 @@
+"""
+Tests for the [fantrax] config.ini reader.
+"""
+import pytest
+
+from utils.fantrax_config import read_fantrax_section
+
+
+def test_read_fantrax_section_boundaries_and_separators(tmp_path):
+	"""Only [fantrax] keys are read, up to the next section; '=' and ':' both work."""
+	path = tmp_path / "config.ini"
+	path.write_text(
+		"[other]\nleague_id = wrong\n\n"
+		"[fantrax]\nleague_id = abc123\ncookie_path: deploy/fantrax.cookie  \nLeague_Name = Mixed\n\n"
+		"[after]\ncookie_path = wrong\n"
+	)
+	values = read_fantrax_section(str(path))
+	assert values == {"league_id": "abc123", "cookie_path": "deploy/fantrax.cookie", "League_Name": "Mixed"}
+
+
+def test_read_fantrax_section_last_section_and_missing(tmp_path):
+	"""A trailing [fantrax] section runs to end of file; a missing one raises ValueError."""
+	path = tmp_path / "config.ini"
+	path.write_text("[fantrax]\nleague_id=L1")
+	assert read_fantrax_section(str(path)) == {"league_id": "L1"}
+	path.write_text("[other]\nleague_id = L1\n")
+	with pytest.raises(ValueError):
+		read_fantrax_section(str(path))
+	with pytest.raises(ValueError):
+		read_fantrax_section(str(tmp_path / "missing.ini"))
@@ -0,0 +1,48 @@
+"""
+Tests for the per-day response cache in scripts/fetch_season_games.py.
+"""
+import importlib.util
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pandas")
+pytest.importorskip("tenacity")
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "fetch_season_games.py"
+_spec = importlib.util.spec_from_file_location("fetch_season_games", _SCRIPT)
+fetch_season_games = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fetch_season_games)
+
+
+def _cache(tmp_path: Path, mtime: datetime) -> Path:
+	cache_file = tmp_path / "day.json"
+	cache_file.write_text(json.dumps({"events": []}))
+	os.utime(cache_file, (mtime.timestamp(), mtime.timestamp()))
+	return cache_file
+
+
+def test_past_day_cached_before_it_settled_is_refetched(tmp_path):
+	"""A past day whose copy was written before it settled still expires."""
+	day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=10)
+	cache_file = _cache(tmp_path, day - timedelta(days=3))
+	assert fetch_season_games.read_day_cache(cache_file, day) is None
+
+
+def test_past_day_cached_after_it_settled_is_kept(tmp_path):
+	"""A copy written two days after the day is reused however old it is."""
+	day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=10)
+	cache_file = _cache(tmp_path, day + timedelta(days=3))
+	assert fetch_season_games.read_day_cache(cache_file, day) == {"events": []}
+
+
+def test_recent_cache_within_ttl_is_kept(tmp_path):
+	"""An unsettled day's copy is reused until DAY_CACHE_TTL passes."""
+	day = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+	cache_file = _cache(tmp_path, datetime.fromtimestamp(time.time() - 60, tz=timezone.utc))
+	assert fetch_season_games.read_day_cache(cache_file, day) == {"events": []}
@@ -0,0 +1,134 @@
+"""
+Tests for LeagueService request flow.
+"""
+import pytest
+from requests import Session
+
+from fantraxapi import FantraxAPI
+from fantraxapi.exceptions import FantraxException
+
+
+class _FakeResponse:
+	status_code = 200
+	reason = "OK"
+
+	def __init__(self, payload: dict):
+		self._payload = payload
+
+	def json(self):
+		return self._payload
+
+
+def test_list_rosters_single_request():
+	"""Every team's getTeamRosterInfo shares one POST after the team list is known."""
+	posts = []
+	session = Session()
+
+	def _post(url, params=None, json=None):
+		msgs = json["msgs"]
+		posts.append([m["method"] for m in msgs])
+		if msgs[0]["method"] == "getFantasyTeams":
+			return _FakeResponse({"responses": [{"data": {"fantasyTeams": [
+				{"id": "t1", "name": "One"}, {"id": "t2", "name": "Two"},
+			]}}]})
+		return _FakeResponse({"responses": [
+			{"data": {"tables": [{"rows": [{"posId": 701, "statusId": "1", "scorer": {"scorerId": m["data"]["teamId"] + "-p"}}]}]}}
+			for m in msgs
+		]})
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	rosters = api.league.list_rosters()
+	assert posts == [["getFantasyTeams"], ["getTeamRosterInfo", "getTeamRosterInfo"]]
+	assert [r.team_id for r in rosters] == ["t1", "t2"]
+	assert rosters[1].rows[0].player.id == "t2-p"
+	assert rosters[0].team.name == "One"
+
+
+def test_faab_budgets_single_request():
+	"""Every team's CLAIMS view shares one POST; teams without a claimBudget are left out."""
+	posts = []
+	session = Session()
+
+	def _post(url, params=None, json=None):
+		msgs = json["msgs"]
+		posts.append([m["method"] for m in msgs])
+		if msgs[0]["method"] == "getFantasyTeams":
+			return _FakeResponse({"responses": [{"data": {"fantasyTeams": [
+				{"id": "t1", "name": "One"}, {"id": "t2", "name": "Two"},
+			]}}]})
+		return _FakeResponse({"responses": [
+			{"data": {"miscData": {"transactionSalaryBudgetInfo": [
+				{"key": "claimBudget", "value": "42.5", "display": "$42.50"},
+			]}}},
+			{"data": {}},
+		]})
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	budgets = api.league.faab_budgets()
+	assert posts == [["getFantasyTeams"], ["getTeamRosterInfo", "getTeamRosterInfo"]]
+	assert budgets == {"t1": {"value": 42.5, "display": "$42.50", "tradeable": False}}
+
+
+def test_get_claims_overview_one_settings_view():
+	"""Only the first team's CLAIMS view is requested, batched with every team's PENDING_CLAIMS."""
+	posts = []
+	session = Session()
+
+	def _post(url, params=None, json=None):
+		msgs = json["msgs"]
+		posts.append([(m["data"]["teamId"], m["data"]["view"]) for m in msgs])
+		return _FakeResponse({"responses": [
+			{"data": {"claimTypes": {"BIDDING": "Bidding"}, "miscData": {"claimGroupsEnabled": True}}}
+			if m["data"]["view"] == "CLAIMS" else
+			{"data": {"tables": [{"txSets": [{"txSetId": m["data"]["teamId"] + "-c"}]}]}}
+			for m in msgs
+		]})
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	overview = api.league.get_claims_overview(["t1", "t2"])
+	assert posts == [[("t1", "CLAIMS"), ("t1", "PENDING_CLAIMS"), ("t2", "PENDING_CLAIMS")]]
+	assert overview["settings"] == {"claimTypes": {"BIDDING": "Bidding"}, "claimGroupsEnabled": True, "showBidColumn": False}
+	assert [c["id"] for c in overview["pendingClaims"]["t2"]] == ["t2-c"]
+
+
+def test_get_claims_overview_reuses_faab_settings():
+	"""After faab_budgets, only PENDING_CLAIMS views are requested; settings come from its CLAIMS responses."""
+	posts = []
+	session = Session()
+
+	def _post(url, params=None, json=None):
+		msgs = json["msgs"]
+		if msgs[0]["method"] == "getFantasyTeams":
+			return _FakeResponse({"responses": [{"data": {"fantasyTeams": [
+				{"id": "t1", "name": "One"}, {"id": "t2", "name": "Two"},
+			]}}]})
+		posts.append([(m["data"]["teamId"], m["data"]["view"]) for m in msgs])
+		return _FakeResponse({"responses": [
+			{"data": {"claimTypes": {"BIDDING": "Bidding"}, "miscData": {"showBidColumn": True}}}
+			if m["data"]["view"] == "CLAIMS" else
+			{"data": {"tables": [{"txSets": [{"txSetId": m["data"]["teamId"] + "-c"}]}]}}
+			for m in msgs
+		]})
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	api.league.faab_budgets()
+	overview = api.league.get_claims_overview(["t1", "t2"])
+	assert posts[1] == [("t1", "PENDING_CLAIMS"), ("t2", "PENDING_CLAIMS")]
+	assert overview["settings"]["showBidColumn"] is True
+	assert [c["id"] for c in overview["pendingClaims"]["t1"]] == ["t1-c"]
+
+
+def test_request_batch_names_failed_msg():
+	"""A sub-response without data raises FantraxException naming the msg, not KeyError."""
+	session = Session()
+	session.post = lambda url, params=None, json=None: _FakeResponse({"responses": [
+		{"data": {"fantasyTeams": []}},
+		{"pageError": {"code": "SOMETHING_BROKE"}},
+	]})
+	api = FantraxAPI("L", session=session)
+	with pytest.raises(FantraxException, match=r"msg 1 \(getTeamRosterInfo\)"):
+		api._request_batch([("getFantasyTeams", {}), ("getTeamRosterInfo", {"teamId": "t1"})])
@@ -0,0 +1,84 @@
+"""
+Tests for the lineup optimizer's value types and polling behaviour.
+"""
+import copy
+import pickle
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+import lineup_optimizer
+from lineup_optimizer import Formation, LineupOptimizer, PlayerStatus
+
+
+def _page(*players: dict) -> dict:
+	return {"responses": [{"data": {
+		"paginatedResultSet": {"totalNumResults": len(players), "totalNumPages": 1},
+		"statsTable": list(players),
+	}}]}
+
+
+@pytest.fixture
+def optimizer(monkeypatch):
+	monkeypatch.setattr(LineupOptimizer, "_init_session", lambda self: Mock())
+	monkeypatch.setattr(lineup_optimizer, "FantraxAPI", Mock())
+	return LineupOptimizer("league1", "team1", "cookies.json")
+
+
+def test_formation_copy_and_pickle():
+	"""Frozen slotted Formation survives copy, deepcopy and pickle round-trips."""
+	f = Formation(1, 4, 4, 2)
+	for clone in (copy.copy(f), copy.deepcopy(f), pickle.loads(pickle.dumps(f))):
+		assert clone == f
+		assert clone.is_legal()
+
+
+def test_player_status_copy_and_pickle():
+	"""Frozen slotted PlayerStatus survives copy and pickle round-trips."""
+	status = PlayerStatus(True, False, datetime(2025, 8, 16, 15, tzinfo=timezone.utc), False, "ARS")
+	for clone in (copy.copy(status), pickle.loads(pickle.dumps(status))):
+		assert clone == status
+		assert not clone.is_confirmed_not_starting()
+
+
+def test_failed_status_fetch_skips_swaps(optimizer, monkeypatch):
+	"""A failed status fetch after a good one leaves no stale statuses to swap on."""
+	monkeypatch.setattr(optimizer, "fetch_player_page", lambda page=1: _page({"scorerId": "p1", "miscDisplayType": "10"}))
+	optimizer.update_player_statuses()
+	assert optimizer.get_player_status("p1").is_starting
+
+	def fail(page=1):
+		raise ConnectionError("boom")
+
+	monkeypatch.setattr(optimizer, "fetch_player_page", fail)
+	monkeypatch.setattr(optimizer, "find_optimal_swaps", Mock(return_value=[(Mock(), Mock(), "reason", None, None)]))
+	optimizer.optimize_lineup()
+
+	assert optimizer.player_statuses == {}
+	optimizer.find_optimal_swaps.assert_not_called()
+	optimizer.api.swap_players.assert_not_called()
+
+
+def test_next_check_delay_ignores_past_locks(optimizer):
+	"""Lock times already passed don't pin the delay to its floor."""
+	now = datetime.now(timezone.utc)
+	optimizer._statuses_valid = True
+	optimizer.player_statuses = {
+		"past": PlayerStatus(True, False, now - timedelta(hours=1), False, "ARS"),
+		"soon": PlayerStatus(True, False, now + timedelta(minutes=1, seconds=10), False, "CHE"),
+		"later": PlayerStatus(True, False, now + timedelta(minutes=11), False, "LIV"),
+	}
+	assert optimizer.next_check_delay(300) == LineupOptimizer.MIN_CHECK_DELAY
+
+	del optimizer.player_statuses["soon"]
+	assert 500 < optimizer.next_check_delay(900) <= 600
+
+	del optimizer.player_statuses["later"]
+	assert optimizer.next_check_delay(300) == 300
+
+
+def test_next_check_delay_after_failed_fetch(optimizer):
+	"""With no valid statuses the loop waits the full interval."""
+	optimizer._statuses_valid = False
+	assert optimizer.next_check_delay(300) == 300
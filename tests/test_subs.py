@@ -0,0 +1,161 @@
+"""
+Tests for lineup planning helpers in SubsService.
+"""
+from unittest.mock import Mock
+
+import pytest
+from requests import Session
+
+from fantraxapi.objs import Roster
+from fantraxapi.subs import Formation, SubsService
+
+_POS_IDS = {"F": 701, "M": 702, "D": 703, "G": 704}
+
+
+def _row(pid: str, pos: str, starter: bool, locked: bool = False) -> dict:
+	return {
+		"posId": _POS_IDS[pos] if starter else 0,
+		"statusId": "1" if starter else "2",
+		"posShortNames": pos,
+		"isLocked": locked,
+		"scorer": {"scorerId": pid, "name": pid, "posShortNames": pos},
+	}
+
+
+@pytest.fixture
+def roster():
+	"""4-4-2 starting XI plus one bench player per position and a second bench forward."""
+	rows = [_row("g1", "G", True)]
+	rows += [_row(f"d{i}", "D", True) for i in range(4)]
+	rows += [_row(f"m{i}", "M", True) for i in range(4)]
+	rows += [_row(f"f{i}", "F", True) for i in range(2)]
+	rows += [_row("g2", "G", False), _row("d9", "D", False), _row("m9", "M", False)]
+	rows += [_row("f8", "F", False), _row("f9", "F", False)]
+	return Roster(Mock(), {"tables": [{"rows": rows}]}, "team1")
+
+
+@pytest.fixture
+def subs():
+	return SubsService(Session())
+
+
+def _plan(subs, roster, desired):
+	return subs._plan_swaps(roster, desired, ensure_unlocked=True, warnings=[], errors=[])
+
+
+def test_pos_counts_for_rows(subs, roster):
+	"""Counts every G/D/M/F row once."""
+	assert subs._pos_counts_for_rows(roster.rows) == Formation(2, 5, 5, 4)
+
+
+def test_plan_same_position_swap(subs, roster):
+	"""A like-for-like change is a single swap."""
+	desired = ["g1", "d0", "d1", "d2", "d9", "m0", "m1", "m2", "m3", "f0", "f1"]
+	assert _plan(subs, roster, desired) == [("d3", "d9")]
+
+
+def test_plan_outfield_rebalance(subs, roster):
+	"""4-4-2 -> 4-2-4 moves exactly two midfielders out for two forwards."""
+	desired = ["g1", "d0", "d1", "d2", "d3", "m0", "m1", "f0", "f1", "f8", "f9"]
+	plan = _plan(subs, roster, desired)
+	assert len(plan) == 2
+	assert {out for out, _ in plan} == {"m2", "m3"}
+	assert {inn for _, inn in plan} == {"f8", "f9"}
+
+
+def test_plan_no_changes(subs, roster):
+	"""Current XI == desired XI yields an empty plan."""
+	desired = ["g1", "d0", "d1", "d2", "d3", "m0", "m1", "m2", "m3", "f0", "f1"]
+	assert _plan(subs, roster, desired) == []
+
+
+def test_plan_skips_locked_without_dropping_partner(subs):
+	"""A locked incoming player is skipped; the outgoing player still pairs with an unlocked one."""
+	rows = [_row("g1", "G", True), _row("f0", "F", True), _row("f1", "F", True)]
+	rows += [_row(f"d{i}", "D", True) for i in range(4)]
+	rows += [_row(f"m{i}", "M", True) for i in range(4)]
+	rows += [_row("d8", "D", False, locked=True), _row("d9", "D", False)]
+	roster = Roster(Mock(), {"tables": [{"rows": rows}]}, "team1")
+	desired = ["g1", "d0", "d1", "d8", "d9", "m0", "m1", "m2", "m3", "f0", "f1"]
+	warnings = []
+	plan = subs._plan_swaps(roster, desired, ensure_unlocked=True, warnings=warnings, errors=[])
+	assert len(plan) == 1
+	assert plan[0][1] == "d9"
+	assert warnings == ["Skipped d8: locked."]
+
+
+class _FakeResponse:
+	def __init__(self, payload: dict):
+		self.status_code = 200
+		self.headers = {}
+		self._payload = payload
+
+	def json(self):
+		return self._payload
+
+
+def test_apply_lineup_atomic_single_round_trip(subs):
+	"""Confirm and execute go out as two msgs in one POST; both responses are parsed."""
+	calls = []
+
+	def _post(url, data=None, headers=None, timeout=None):
+		calls.append(data)
+		return _FakeResponse({"responses": [
+			{"data": {"fantasyResponse": {"msgType": "CONFIRM"}}},
+			{"data": {"fantasyResponse": {"msgType": "SUCCESS"}}},
+		]})
+
+	subs.session.post = _post
+	pre, fin = subs.apply_lineup_atomic(
+		league_id="L", fantasy_team_id="T", roster_limit_period=3, field_map={}, apply_to_future=False,
+	)
+	assert len(calls) == 1
+	assert pre["ok"] and pre["fantasyResponse"]["msgType"] == "CONFIRM"
+	assert fin["ok"] and fin["fantasyResponse"]["msgType"] == "SUCCESS"
+
+
+def test_get_current_period_cached(subs, monkeypatch):
+	"""The standings lookup runs once per league until invalidated."""
+	calls = []
+
+	class _Drops:
+		def get_current_period(self):
+			calls.append(1)
+			return 7
+
+	monkeypatch.setattr(subs, "_api", lambda league_id: Mock(drops=_Drops()))
+	subs.invalidate_period("L")
+	assert subs.get_current_period("L") == 7
+	assert subs.get_current_period("L") == 7
+	assert len(calls) == 1
+	subs.invalidate_period("L")
+	assert subs.get_current_period("L") == 7
+	assert len(calls) == 2
+
+
+def test_build_field_map(subs, roster):
+	"""Starters get their slot id, everyone else goes to the bench; overrides win."""
+	desired = ["g1", "d0", "d1", "d2", "d3", "m0", "m1", "m2", "f0", "f1", "f9"]
+	fmap = subs.build_field_map(roster, desired, {"m2": "F"})
+	assert len(fmap) == len(roster.rows)
+	assert fmap["g1"] == {"posId": 704, "stId": "1"}
+	assert fmap["f9"] == {"posId": 701, "stId": "1"}
+	assert fmap["m2"] == {"posId": 701, "stId": "1"}
+	assert fmap["m3"] == {"posId": 0, "stId": "2"}
+	# Second call reuses the per-roster slot cache
+	assert subs.build_field_map(roster, desired)["m2"] == {"posId": 702, "stId": "1"}
+
+
+def test_parse_lineup_response_shapes():
+	"""fantasyResponse, txResponses and missing/short responses all parse without raising."""
+	parse = SubsService._parse_lineup_response
+	fr = {"responses": [{"data": {"fantasyResponse": {"msgType": "SUCCESS", "mainMsg": "done"}}}]}
+	assert parse(fr, 0, do_finalize=True)["ok"]
+	tx = {"responses": [{"data": {"txResponses": [{"code": "ok_success", "message": "m"}]}}]}
+	res = parse(tx, 0, do_finalize=True)
+	assert res["ok"] and res["mainMsg"] == "m"
+	assert not parse(fr, 1, do_finalize=True)["ok"]
+	assert not parse({"error": "boom"}, 0, do_finalize=False)["ok"]
+	page_error = {"responses": [{"pageError": {"code": "X"}, "data": {"fantasyResponse": {"msgType": "SUCCESS"}}}]}
+	assert not parse(page_error, 0, do_finalize=True)["ok"]
+
@@ -0,0 +1,53 @@
+"""
+Tests for TradesService payload building.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from fantraxapi.exceptions import FantraxException
+from fantraxapi.trades import TradesService
+
+
+def test_propose_trade_transactions():
+	"""Players then FAAB, each leg with the right direction; drops are conditional."""
+	request = Mock(return_value={})
+	svc = TradesService(request, Mock())
+	svc.propose_trade(
+		from_team_id="A",
+		to_team_id="B",
+		player_ids_to_give=["p1"],
+		player_ids_to_receive=["p2"],
+		faab_to_give=5.0,
+		conditional_drops={"p2": "p3"},
+	)
+	method, = request.call_args.args
+	tx = request.call_args.kwargs["transactions"]
+	assert method == "submitTrade"
+	assert [(t["sourceTeamId"], t["destinationTeamId"], t["scorerId"]) for t in tx[:3]] == [
+		("A", "B", "p1"), ("B", "A", "p2"), ("A", "B", "BA_5.0"),
+	]
+	assert all(t["type"] == {"code": "TRADE", "name": "Trade"} for t in tx[:3])
+	assert tx[3] == {
+		"type": {"code": "DROP", "name": "Drop"},
+		"scorerId": "p3",
+		"sourceTeamId": "A",
+		"conditional": True,
+		"conditionalOnScorerId": "p2",
+	}
+
+
+def test_propose_trade_requires_assets():
+	with pytest.raises(FantraxException):
+		TradesService(Mock(), Mock()).propose_trade(from_team_id="A", to_team_id="B")
+
+
+def test_get_trade_details_bulk_single_call():
+	"""One getPendingTransactions call serves every requested id."""
+	request = Mock(return_value={"tradeInfoList": [{"txSetId": "t1"}, {"txSetId": "t2"}]})
+	svc = TradesService(request, Mock())
+	assert svc.get_trade_details_bulk(["t2", "t9"]) == {"t2": {"txSetId": "t2"}}
+	assert request.call_count == 1
+	assert svc.get_trade_details("t1") == {"txSetId": "t1"}
+	with pytest.raises(FantraxException):
+		svc.get_trade_details("t9")
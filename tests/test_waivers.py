@@ -0,0 +1,172 @@
+"""
+Tests for WaiversService request flow.
+"""
+from requests import Session
+
+from fantraxapi import FantraxAPI
+
+
+class _FakeResponse:
+	status_code = 200
+	reason = "OK"
+
+	def __init__(self, n: int):
+		self._n = n
+
+	def json(self):
+		return {"responses": [{"data": {"i": i}} for i in range(self._n)]}
+
+
+def test_submit_claim_single_request():
+	"""The three UI calls go out in order in one POST; createClaimDrop's data is returned."""
+	posts = []
+	session = Session()
+
+	def _post(url, params=None, json=None):
+		posts.append([m["method"] for m in json["msgs"]])
+		return _FakeResponse(len(json["msgs"]))
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	result = api.waivers.submit_claim(team_id="T", claim_scorer_id="p1", bid_amount=3.0)
+	assert posts == [["getScorerDetails", "getClaimDropConfirmInfo", "createClaimDrop"]]
+	assert result == {"i": 2}
+
+
+def _stats_page(page: int, total: int, per_page: int) -> dict:
+	return {
+		"statsTable": [
+			{"scorer": {"scorerId": f"p{page}-{i}", "name": f"Player {page}-{i}"}} for i in range(per_page)
+		],
+		"paginatedResultSet": {"totalNumPages": total},
+	}
+
+
+def test_list_players_by_name_batches_remaining_pages():
+	"""Page 1 goes alone; the remaining pages needed for `limit` share one POST."""
+	posts = []
+	session = Session()
+
+	class _Resp(_FakeResponse):
+		def __init__(self, msgs):
+			self._msgs = msgs
+
+		def json(self):
+			return {"responses": [
+				{"data": _stats_page(int(m["data"]["pageNumber"]), 5, int(m["data"]["maxResultsPerPage"]))}
+				for m in self._msgs
+			]}
+
+	def _post(url, params=None, json=None):
+		posts.append([m["data"]["pageNumber"] for m in json["msgs"]])
+		return _Resp(json["msgs"])
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	players = api.waivers.list_players_by_name(limit=120)
+	assert posts == [["1"], ["2", "3"]]
+	assert len(players) == 120
+	assert players[0]["id"] == "p1-0" and players[-1]["id"] == "p3-19"
+
+
+def test_player_stats_pages_cached_until_cleared():
+	"""A repeat listing within the TTL is served from cache; clear_cache forces a refetch."""
+	posts = []
+	session = Session()
+
+	class _Resp(_FakeResponse):
+		def __init__(self, msgs):
+			self._msgs = msgs
+
+		def json(self):
+			return {"responses": [{"data": _stats_page(1, 1, 10)} for _ in self._msgs]}
+
+	def _post(url, params=None, json=None):
+		posts.append(len(json["msgs"]))
+		return _Resp(json["msgs"])
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	assert len(api.waivers.list_players_by_name(limit=10)) == 10
+	assert len(api.waivers.list_players_by_name(limit=10)) == 10
+	assert posts == [1]
+	api.waivers.clear_cache()
+	api.waivers.list_players_by_name(limit=10)
+	assert posts == [1, 1]
+
+
+def test_parse_page_keeps_only_summaries():
+	"""Pages are reduced to player summaries, the raw row count and pagination."""
+	from fantraxapi.waivers import WaiversService
+
+	row = {"cells": [{"content": "1.0"}] * 20, "scorer": {"scorerId": "p1", "name": "A", "teamShortName": "ARS", "icons": [1, 2]}}
+	page = WaiversService._parse_page({"statsTable": [row, {"scorer": {}}], "paginatedResultSet": {"totalNumPages": 3}, "tableHeader": {}})
+	assert page == {
+		"players": [{"id": "p1", "name": "A", "team": "ARS", "position": None, "default_pos_id": None}],
+		"numRows": 2,
+		"paginatedResultSet": {"totalNumPages": 3},
+	}
+	assert WaiversService._parse_page(None) == {"players": [], "numRows": 0, "paginatedResultSet": {}}
+
+
+def test_search_players_fallback_single_batch():
+	"""An empty server-side search falls back to one batched POST, bounded by totalNumPages."""
+	posts = []
+	session = Session()
+
+	class _Resp(_FakeResponse):
+		def __init__(self, msgs):
+			self._msgs = msgs
+
+		def json(self):
+			if "query" in self._msgs[0]["data"]:
+				return {"responses": [{"data": {"statsTable": []}}]}
+			return {"responses": [{"data": _stats_page(int(m["data"]["pageNumber"]), 2, 5)} for m in self._msgs]}
+
+	def _post(url, params=None, json=None):
+		posts.append(len(json["msgs"]))
+		return _Resp(json["msgs"])
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	players = api.waivers.search_players("player 2-", max_results=3)
+	assert posts == [1, 10]
+	assert [p["id"] for p in players] == ["p2-0", "p2-1", "p2-2"]
+	assert len(api.waivers.search_players("player", max_results=50)) == 10
+
+
+def test_concurrent_identical_pages_share_one_request():
+	"""Two threads asking for the same uncached page cause a single POST."""
+	import threading
+	import time
+
+	posts = []
+	release = threading.Event()
+	session = Session()
+
+	class _Resp(_FakeResponse):
+		def __init__(self, msgs):
+			self._msgs = msgs
+
+		def json(self):
+			return {"responses": [{"data": _stats_page(1, 1, 3)} for _ in self._msgs]}
+
+	def _post(url, params=None, json=None):
+		posts.append(len(json["msgs"]))
+		release.wait(2)
+		return _Resp(json["msgs"])
+
+	session.post = _post
+	api = FantraxAPI("L", session=session)
+	results = []
+	threads = [threading.Thread(target=lambda: results.append(api.waivers._fetch_player_stats_page())) for _ in range(2)]
+	for t in threads:
+		t.start()
+	while not posts:
+		time.sleep(0.01)
+	time.sleep(0.05)
+	release.set()
+	for t in threads:
+		t.join()
+	assert posts == [1]
+	assert results[0] is results[1]
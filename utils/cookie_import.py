@@ -1,11 +1,17 @@
 # utils/cookie_import.py
 from __future__ import annotations
-import json, pickle
-from typing import Any, Dict, List, IO
+import json, logging, pickle
+from pathlib import Path
+from typing import Any, Dict, List, IO, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 Cookie = Dict[str, Any]
 Artifacts = Dict[str, Any]
 
+# cookie_path -> (pickle mtime, cookies) for processes that load repeatedly
+_LOADED: Dict[str, Tuple[Optional[float], Dict[str, str]]] = {}
+
 def _normalize_cookie_list(lst: List[Dict[str, Any]]) -> List[Cookie]:
 	out: List[Cookie] = []
 	for c in lst:
@@ -52,3 +58,31 @@ def read_auth_file(f: IO[bytes]) -> Artifacts:
 		pass
 
 	raise ValueError("Unsupported file format. Provide a Selenium cookie pickle, Cookie-Editor JSON, or an artifact bundle.")
+
+def load_cookie_dict(cookie_path: str) -> Dict[str, str]:
+	"""
+	Load {name: value} cookies, preferring a JSON sidecar next to the pickle.
+
+	The Selenium pickle written by setup_cookies.py is converted once to
+	``<cookie_path>.json``; later runs read that instead of unpickling. The
+	sidecar is ignored (and rewritten) whenever the pickle is newer. Within
+	one process, repeat calls are served from memory until the pickle changes.
+	"""
+	pickle_path = Path(cookie_path)
+	pickle_mtime = pickle_path.stat().st_mtime if pickle_path.exists() else None
+	hit = _LOADED.get(cookie_path)
+	if hit is not None and hit[0] == pickle_mtime:
+		return dict(hit[1])
+
+	json_path = pickle_path.with_name(pickle_path.name + ".json")
+	if json_path.exists() and (pickle_mtime is None or json_path.stat().st_mtime >= pickle_mtime):
+		cookies = json.loads(json_path.read_text())
+	else:
+		with open(pickle_path, "rb") as f:
+			cookies = {cookie["name"]: cookie["value"] for cookie in pickle.load(f)}
+		try:
+			json_path.write_text(json.dumps(cookies))
+		except OSError as e:
+			logger.warning("Could not write cookie cache %s: %s", json_path, e)
+	_LOADED[cookie_path] = (pickle_mtime, cookies)
+	return dict(cookies)
@@ -0,0 +1,27 @@
+# utils/fantrax_config.py
+from __future__ import annotations
+import re
+from typing import Dict
+
+_FANTRAX_SECTION_RE = re.compile(r"^\[fantrax\][ \t]*$(.*?)(?=^\[|\Z)", re.M | re.S)
+_CONFIG_KEY_RE = re.compile(r"^[ \t]*(\w+)[ \t]*[=:][ \t]*(.*?)[ \t]*$", re.M)
+
+def read_fantrax_section(config_path: str = "config.ini") -> Dict[str, str]:
+	"""
+	Return the flat ``key = value`` / ``key: value`` pairs of config.ini's
+	[fantrax] section, without importing configparser.
+
+	Unlike configparser, keys are case-sensitive (``League_ID`` is not
+	``league_id``), [DEFAULT] values are not inherited, and there is no
+	interpolation or multi-line values. Raises ValueError when the file or
+	the section is missing.
+	"""
+	try:
+		with open(config_path, encoding="utf-8") as f:
+			text = f.read()
+	except FileNotFoundError:
+		text = ""
+	section = _FANTRAX_SECTION_RE.search(text)
+	if not section:
+		raise ValueError("config.ini must have a [fantrax] section")
+	return dict(_CONFIG_KEY_RE.findall(section.group(1)))